@@ -5,8 +5,13 @@ Main application file with modular architecture
 
 from flask import Flask
 from flask_cors import CORS
+from flask_caching import Cache
 import os
+import sys
+import atexit
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 # Import configuration and managers from extend folder
 from extend.config_manager import ConfigManager
@@ -23,63 +28,106 @@ from extend.track_manager import TrackManager
 from extend.sources_api import SourcesAPI
 from extend.system_utils import SystemUtils
 from extend.routes import register_routes
+from extend.json_provider import OrjsonProvider
 
-# Initialize Flask app
-app = Flask(__name__)
-CORS(app)  # Enable CORS for userscript communication
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-logger.info("="*60)
-logger.info("🎵 Blissful - Lidarr Music Downloader")
-logger.info("="*60)
-
-# Initialize core managers
-logger.info("📦 Initializing core managers...")
-
-config_manager = ConfigManager()
-download_manager = DownloadManager()
-audio_converter = AudioConverter()
-source_manager = SourceManager()
-
-logger.info("✅ Core managers initialized")
-
-# Initialize new modular managers
-logger.info("🔧 Initializing modular managers...")
-
-auth_manager = AuthManager(config_manager)
-request_manager = RequestManager(config_manager, LidarrClient)
-album_manager = AlbumManager(config_manager, LidarrClient, download_manager, audio_converter)
-track_manager = TrackManager(config_manager, LidarrClient, download_manager, audio_converter)
-sources_api = SourcesAPI(source_manager)
-system_utils = SystemUtils(config_manager)
 
-logger.info("✅ All modular managers initialized")
+def create_app() -> Flask:
+    """
+    Build the Blissful app: logging, managers and API routes
+    
+    Nothing runs at import time, so conversion pool workers (which re-import
+    this module as __mp_main__ under the spawn start method) stay lightweight.
+    
+    Returns:
+        Configured Flask app
+    """
+    # Initialize Flask app
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)  # Fast JSON for API requests and responses
+    CORS(app)  # Enable CORS for userscript communication
+    
+    # In-memory cache for read-mostly Lidarr lookups
+    cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 60})
+    
+    # Setup logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    # Hand log records to a background thread so request handlers never wait
+    # on a slow handler (console, file, syslog)
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    log_listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    root_logger.handlers = [QueueHandler(log_queue)]
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    
+    logger.info("="*60)
+    logger.info("🎵 Blissful - Lidarr Music Downloader")
+    logger.info("="*60)
+    
+    # Initialize core managers
+    logger.info("📦 Initializing core managers...")
+    
+    config_manager = ConfigManager()
+    atexit.register(config_manager.flush)  # write any debounced update_setting changes
+    download_manager = DownloadManager()
+    atexit.register(download_manager.close)
+    audio_converter = AudioConverter()
+    source_manager = SourceManager()
+    
+    # Every download goes through ffmpeg - refuse to start without it rather than
+    # failing at conversion time after the audio has already been downloaded
+    for tool, available in (('ffmpeg', audio_converter.check_ffmpeg()), ('ffprobe', audio_converter.check_ffprobe())):
+        if not available:
+            logger.error(f"❌ {tool} not available - refusing to start. Install FFmpeg and make sure it is on PATH.")
+            sys.exit(1)
+    
+    logger.info("✅ Core managers initialized")
+    
+    # Initialize new modular managers
+    logger.info("🔧 Initializing modular managers...")
+    
+    auth_manager = AuthManager(config_manager)
+    request_manager = RequestManager(config_manager, LidarrClient)
+    album_manager = AlbumManager(config_manager, LidarrClient, download_manager, audio_converter)
+    track_manager = TrackManager(config_manager, LidarrClient, download_manager, audio_converter)
+    sources_api = SourcesAPI(source_manager)
+    system_utils = SystemUtils(config_manager)
+    
+    logger.info("✅ All modular managers initialized")
+    
+    # Register all API routes
+    logger.info("🛣️  Registering API routes...")
+    register_routes(
+        app=app,
+        cache=cache,
+        config_manager=config_manager,
+        lidarr_client=LidarrClient,
+        download_manager=download_manager,
+        audio_converter=audio_converter,
+        source_manager=source_manager,
+        auth_manager=auth_manager,
+        request_manager=request_manager,
+        album_manager=album_manager,
+        track_manager=track_manager,
+        sources_api=sources_api,
+        system_utils=system_utils
+    )
+    logger.info("✅ All routes registered successfully")
+    
+    return app
 
-# Register all API routes
-logger.info("🛣️  Registering API routes...")
-register_routes(
-    app=app,
-    config_manager=config_manager,
-    lidarr_client=LidarrClient,
-    download_manager=download_manager,
-    audio_converter=audio_converter,
-    source_manager=source_manager,
-    auth_manager=auth_manager,
-    request_manager=request_manager,
-    album_manager=album_manager,
-    track_manager=track_manager,
-    sources_api=sources_api,
-    system_utils=system_utils
-)
-logger.info("✅ All routes registered successfully")
 
 if __name__ == '__main__':
+    # Development / Windows entrypoint. Production runs under gunicorn with
+    # gevent workers via wsgi.py (see Dockerfile).
+    app = create_app()
+    
     # Ensure directories exist
     os.makedirs('downloads', exist_ok=True)
     os.makedirs('templates', exist_ok=True)
@@ -98,4 +146,6 @@ if __name__ == '__main__':
     logger.info("Press Ctrl+C to stop")
     logger.info("="*60)
     
-    app.run(host='0.0.0.0', port=port, debug=True)
+    # Debugger and reloader are opt-in for development only
+    debug = os.environ.get('BLISSFUL_DEBUG', '0') == '1'
+    app.run(host='0.0.0.0', port=port, debug=debug, use_reloader=debug)
@@ -4,6 +4,7 @@ Handles album information, tracks, and bulk album downloads
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,25 @@ class AlbumManager:
         self.LidarrClient = lidarr_client_class
         self.download_manager = download_manager
         self.audio_converter = audio_converter
+        self._lidarr_client = None
+        self._client_key = None
+    
+    def _client(self, config):
+        """
+        Get a Lidarr client for the configured URL/API key, reusing the
+        previous instance (and its HTTP session) while the settings are unchanged
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            LidarrClient instance
+        """
+        key = (config.get('lidarr_url'), config.get('lidarr_api_key'))
+        if key != self._client_key:
+            self._lidarr_client = self.LidarrClient(url=key[0], api_key=key[1])
+            self._client_key = key
+        return self._lidarr_client
     
     def get_album_info(self, album_id):
         """
@@ -39,8 +59,7 @@ class AlbumManager:
                     'error': 'Lidarr not configured'
                 }
             
-            # Create Lidarr client
-            lidarr_client = self.LidarrClient(url=lidarr_url, api_key=lidarr_api_key)
+            lidarr_client = self._client(config)
             
             # Fetch album data
             album_data = lidarr_client.get_album_by_foreign_id(album_id)
@@ -96,8 +115,7 @@ class AlbumManager:
                     'error': 'Lidarr not configured'
                 }
             
-            # Create Lidarr client
-            lidarr_client = self.LidarrClient(url=lidarr_url, api_key=lidarr_api_key)
+            lidarr_client = self._client(config)
             
             # Fetch tracks
             tracks = lidarr_client.get_album_tracks(int(album_id))
@@ -109,16 +127,17 @@ class AlbumManager:
                 }
             
             # Format track data
-            track_list = []
-            for track in tracks:
-                track_list.append({
+            track_list = [
+                {
                     'id': track.get('id'),
                     'trackNumber': track.get('trackNumber'),
                     'title': track.get('title'),
                     'duration': track.get('duration', 0),
                     'hasFile': track.get('hasFile', False),
                     'trackFileId': track.get('trackFileId'),
-                })
+                }
+                for track in tracks
+            ]
             
             logger.info(f"Fetched {len(track_list)} tracks for album {album_id}")
             
@@ -162,55 +181,18 @@ class AlbumManager:
             }
             
             config = self.config_manager.get_config()
+            max_workers = max(1, int(config.get('album_concurrency', 4)))
             
-            for track in tracks:
-                track_result = {
-                    'title': track.get('title'),
-                    'success': False,
-                    'error': None
-                }
-                
-                try:
-                    # Download track
-                    download_result = self.download_manager.download_track(
-                        artist=artist,
-                        title=track.get('title'),
-                        album=album,
-                        output_format=config.get('output_format', 'mp3'),
-                        source_priorities=config.get('source_priorities', [])
-                    )
-                    
-                    if download_result['success']:
-                        # Convert track
-                        converted_file = self.audio_converter.convert(
-                            input_file=download_result['file_path'],
-                            output_format=config.get('output_format', 'mp3'),
-                            quality=config.get('quality', '320k')
-                        )
-                        
-                        # Move to target if specified
-                        if target_path and config.get('lidarr_path_mapping'):
-                            final_path = self.download_manager.move_to_target(
-                                source_file=converted_file,
-                                target_path=track.get('target_path', target_path),
-                                path_mapping=config.get('lidarr_path_mapping')
-                            )
-                            track_result['file_path'] = final_path
-                        else:
-                            track_result['file_path'] = converted_file
-                        
-                        track_result['success'] = True
-                        results['successful'] += 1
-                    else:
-                        track_result['error'] = download_result.get('error')
-                        results['failed'] += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error downloading track {track.get('title')}: {e}")
-                    track_result['error'] = str(e)
-                    results['failed'] += 1
-                
-                results['tracks'].append(track_result)
+            # Tracks are independent (network download + ffmpeg subprocess),
+            # so run them concurrently while preserving result order
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results['tracks'] = list(executor.map(
+                    lambda track: self._download_one(track, artist, album, target_path, config),
+                    tracks
+                ))
+            
+            results['successful'] = sum(1 for t in results['tracks'] if t['success'])
+            results['failed'] = len(results['tracks']) - results['successful']
             
             results['success'] = results['failed'] < results['total_tracks']
             
@@ -222,3 +204,78 @@ class AlbumManager:
                 'success': False,
                 'error': str(e)
             }
+    
+    def _download_one(self, track, artist, album, target_path, config):
+        """
+        Download, convert and move a single album track
+        
+        Args:
+            track: Track object with title and optional target_path
+            artist: Artist name
+            album: Album name
+            target_path: Target directory path
+            config: Configuration snapshot for this album download
+            
+        Returns:
+            dict: Result for this track
+        """
+        track_result = {
+            'title': track.get('title'),
+            'success': False,
+            'error': None
+        }
+        
+        try:
+            # Download track
+            download_result = self.download_manager.download_track(
+                artist=artist,
+                title=track.get('title'),
+                album=album,
+                output_format=config.get('output_format', 'mp3'),
+                source_priorities=config.get('source_priorities', []),
+                quality=config.get('quality', '320k')
+            )
+            
+            if download_result['success']:
+                metadata = None
+                if config.get('embed_metadata', True):
+                    metadata = {
+                        'artist': artist,
+                        'title': track.get('title'),
+                        'album': album,
+                        'track': track.get('trackNumber')
+                    }
+                
+                target_level = self.audio_converter.get_loudness_target(config)
+                
+                # Convert track on the shared process pool (CPU-bound encode);
+                # convert() itself only normalizes and tags a file that is
+                # already in the target format
+                converted_file = self.audio_converter.convert_pooled(
+                    input_file=download_result['file_path'],
+                    output_format=config.get('output_format', 'mp3'),
+                    quality=config.get('quality', '320k'),
+                    metadata=metadata,
+                    target_level=target_level
+                )
+                
+                # Move to target if specified
+                if target_path and config.get('lidarr_path_mapping'):
+                    final_path = self.download_manager.move_to_target(
+                        source_file=converted_file,
+                        target_path=track.get('target_path', target_path),
+                        path_mapping=config.get('lidarr_path_mapping')
+                    )
+                    track_result['file_path'] = final_path
+                else:
+                    track_result['file_path'] = converted_file
+                
+                track_result['success'] = True
+            else:
+                track_result['error'] = download_result.get('error')
+                
+        except Exception as e:
+            logger.error(f"Error downloading track {track.get('title')}: {e}")
+            track_result['error'] = str(e)
+        
+        return track_result
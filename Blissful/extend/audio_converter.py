@@ -1,42 +1,180 @@
 import subprocess
 import os
 import logging
+import shutil
+import tempfile
+import threading
+import multiprocessing
+from contextlib import suppress
+import orjson
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+try:
+    import av
+except ImportError:
+    av = None
+
+try:
+    import mutagen
+except ImportError:
+    mutagen = None
+
 logger = logging.getLogger(__name__)
 
+# PyAV encoder settings per output format: (codec, uses bitrate, codec options)
+PYAV_CODECS = {
+    'mp3': ('libmp3lame', True, {}),
+    'flac': ('flac', False, {'compression_level': '8'}),
+    'wav': ('pcm_s16le', False, {}),
+    'ogg': ('libvorbis', False, {'qscale': '8'}),
+    'opus': ('libopus', True, {}),
+    'm4a': ('aac', True, {}),
+    'aac': ('aac', True, {}),
+}
+
+# ffmpeg metadata keys that mutagen's easy interface names differently
+MUTAGEN_TAG_KEYS = {
+    'track': 'tracknumber',
+}
+
+# Suppress the banner and per-frame progress so stderr only carries errors
+FFMPEG_QUIET_ARGS = ('-hide_banner', '-nostats', '-loglevel', 'error')
+
+# Single-pass loudness normalization filter and targets (LUFS)
+LOUDNORM_FILTER = 'loudnorm=I={target_level}:TP=-1.5:LRA=11'
+DEFAULT_LOUDNESS_LEVEL = '-14.0'
+EBU_R128_LEVEL = '-23.0'
+
+# ffmpeg encoder arguments per output format ({quality} is the bitrate)
+FFMPEG_CODEC_ARGS = {
+    'mp3': ('-codec:a', 'libmp3lame', '-b:a', '{quality}', '-q:a', '0'),
+    'flac': ('-codec:a', 'flac', '-compression_level', '8'),
+    'wav': ('-codec:a', 'pcm_s16le'),
+    'ogg': ('-codec:a', 'libvorbis', '-q:a', '8'),
+    'opus': ('-codec:a', 'libopus', '-b:a', '{quality}'),
+    'm4a': ('-codec:a', 'aac', '-b:a', '{quality}'),
+    'aac': ('-codec:a', 'aac', '-b:a', '{quality}'),
+}
+
+# Input extensions whose audio already suits an output format, so only the
+# container changes (yt-dlp delivers AAC as .m4a)
+REMUX_SOURCES = {
+    'aac': ('m4a',),
+}
+
+# ffmpeg muxer per file extension, passed with -f so it isn't guessed
+FFMPEG_MUXERS = {
+    'mp3': 'mp3',
+    'flac': 'flac',
+    'wav': 'wav',
+    'ogg': 'ogg',
+    'opus': 'opus',
+    'm4a': 'ipod',
+    'aac': 'adts',
+}
+
+# Sample rates accepted by libopus
+OPUS_RATES = (48000, 24000, 16000, 12000, 8000)
+
+# Shared process pool for CPU-bound encodes, created on first use
+_convert_pool = None
+_convert_pool_lock = threading.Lock()
+
+
+def _get_convert_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared conversion process pool, creating it lazily
+    
+    Returns:
+        ProcessPoolExecutor sized to the number of CPUs
+    """
+    global _convert_pool
+    with _convert_pool_lock:
+        if _convert_pool is None:
+            # Spawn (not fork) so workers don't inherit gevent/thread state
+            _convert_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _convert_pool
+
+
+def _convert_worker(
+    input_file: str,
+    output_format: str,
+    quality: str,
+    metadata: Optional[dict] = None,
+    target_level: Optional[str] = None
+) -> str:
+    """Process pool entry point for AudioConverter.convert"""
+    return AudioConverter().convert(
+        input_file,
+        output_format=output_format,
+        quality=quality,
+        metadata=metadata,
+        target_level=target_level
+    )
+
+
 class AudioConverter:
     """Audio converter using ffmpeg"""
     
     def __init__(self):
         """Initialize audio converter"""
-        self.supported_formats = ['mp3', 'flac', 'wav', 'ogg', 'opus', 'm4a', 'aac']
+        self.supported_formats = list(FFMPEG_CODEC_ARGS)
+        self._tool_available = {}
     
     def check_ffmpeg(self) -> bool:
         """
-        Check if ffmpeg is available
+        Check if ffmpeg is available (probed once, then cached)
         
         Returns:
             True if ffmpeg is available
         """
-        try:
-            result = subprocess.run(
-                ['ffmpeg', '-version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return False
+        return self._check_tool('ffmpeg')
+    
+    def check_ffprobe(self) -> bool:
+        """
+        Check if ffprobe is available (probed once, then cached)
+        
+        Returns:
+            True if ffprobe is available
+        """
+        return self._check_tool('ffprobe')
+    
+    def _check_tool(self, name: str) -> bool:
+        """
+        Run '<name> -version' once and cache whether it succeeded
+        
+        Args:
+            name: Executable name
+            
+        Returns:
+            True if the tool is available
+        """
+        if name not in self._tool_available:
+            try:
+                result = subprocess.run(
+                    [name, '-version'],
+                    capture_output=True,
+                    text=True,
+                    timeout=5
+                )
+                self._tool_available[name] = result.returncode == 0
+            except (subprocess.SubprocessError, FileNotFoundError):
+                self._tool_available[name] = False
+        return self._tool_available[name]
     
     def convert(
         self,
         input_file: str,
         output_format: str = 'mp3',
         quality: str = '320k',
-        output_file: Optional[str] = None
+        output_file: Optional[str] = None,
+        metadata: Optional[dict] = None,
+        target_level: Optional[str] = None
     ) -> str:
         """
         Convert audio file to specified format
@@ -46,66 +184,69 @@ class AudioConverter:
             output_format: Target format (mp3, flac, etc.)
             quality: Audio quality (bitrate for lossy, compression level for lossless)
             output_file: Optional output file path
+            metadata: Optional tags (artist, title, album, date, track) written
+                during the conversion instead of a separate add_metadata pass
+            target_level: Optional loudness target in LUFS, applied with the
+                loudnorm filter during the conversion instead of a separate
+                normalize_audio pass
             
         Returns:
             Path to converted file
         """
         try:
-            input_path = Path(input_file)
+            output_format = output_format.lower()
+            base, ext = os.path.splitext(input_file)
             
             # If input is already in the correct format, return it
-            if input_path.suffix[1:].lower() == output_format.lower():
+            if ext[1:].lower() == output_format:
                 logger.info(f"File already in {output_format} format: {input_file}")
+                if target_level:
+                    self.normalize_audio(input_file, target_level, quality)
+                if metadata:
+                    self.tag_file(input_file, metadata)
                 return input_file
             
+            input_path = Path(input_file)
+            
             # Determine output file path
-            if output_file:
-                output_path = Path(output_file)
-            else:
-                output_path = input_path.with_suffix(f'.{output_format}')
+            output_path = Path(output_file or f'{base}.{output_format}')
             
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
+            # Same codec in a different container: copy the stream, don't re-encode
+            remux = not target_level and ext[1:].lower() in REMUX_SOURCES.get(output_format, ())
+            
+            # Encode in-process with libav when available to skip the ffmpeg fork
+            # (loudness normalization needs ffmpeg's loudnorm filter)
+            if not remux and not target_level and self._convert_with_pyav(input_path, output_path, output_format, quality, metadata):
+                if output_path != input_path and input_path.exists():
+                    input_path.unlink()
+                    logger.debug(f"Removed original file: {input_path}")
+                
+                logger.info(f"Successfully converted to: {output_path}")
+                return str(output_path)
+            
             # Build ffmpeg command
-            cmd = ['ffmpeg', '-i', str(input_path), '-y']  # -y to overwrite
+            cmd = ['ffmpeg', *FFMPEG_QUIET_ARGS, '-i', str(input_path), '-y']  # -y to overwrite
             
             # Add format-specific options
-            if output_format.lower() == 'mp3':
-                cmd.extend([
-                    '-codec:a', 'libmp3lame',
-                    '-b:a', quality,
-                    '-q:a', '0'  # Highest quality VBR
-                ])
-            elif output_format.lower() == 'flac':
-                cmd.extend([
-                    '-codec:a', 'flac',
-                    '-compression_level', '8'  # Max compression
-                ])
-            elif output_format.lower() == 'wav':
-                cmd.extend([
-                    '-codec:a', 'pcm_s16le'
-                ])
-            elif output_format.lower() == 'ogg':
-                cmd.extend([
-                    '-codec:a', 'libvorbis',
-                    '-q:a', '8'  # High quality
-                ])
-            elif output_format.lower() == 'opus':
-                cmd.extend([
-                    '-codec:a', 'libopus',
-                    '-b:a', quality
-                ])
-            elif output_format.lower() in ['m4a', 'aac']:
-                cmd.extend([
-                    '-codec:a', 'aac',
-                    '-b:a', quality
-                ])
+            if remux:
+                cmd.extend(['-codec:a', 'copy'])
             else:
-                # Generic conversion
-                cmd.extend(['-b:a', quality])
+                cmd.extend(self._encoder_args(output_format, quality))
+            
+            # Normalize loudness in the same pass
+            if target_level:
+                cmd.extend(self._loudnorm_args(input_path, output_format, target_level))
+            
+            # Add metadata in the same pass
+            for key, value in (metadata or {}).items():
+                if value:
+                    cmd.extend(['-metadata', f'{key}={value}'])
             
             # Add output file
+            cmd.extend(self._muxer_args(output_path))
             cmd.append(str(output_path))
             
             logger.info(f"Converting {input_file} to {output_format}")
@@ -139,9 +280,164 @@ class AudioConverter:
             # Return original file if conversion failed
             return input_file
     
+    def convert_pooled(
+        self,
+        input_file: str,
+        output_format: str = 'mp3',
+        quality: str = '320k',
+        metadata: Optional[dict] = None,
+        target_level: Optional[str] = None
+    ) -> str:
+        """
+        Convert audio file on the shared process pool so concurrent
+        conversions use all CPU cores
+        
+        Args:
+            input_file: Path to input audio file
+            output_format: Target format (mp3, flac, etc.)
+            quality: Audio quality (bitrate for lossy formats)
+            metadata: Optional tags written during the conversion
+            target_level: Optional loudness target in LUFS
+            
+        Returns:
+            Path to converted file
+        """
+        try:
+            future = _get_convert_pool().submit(
+                _convert_worker, input_file, output_format, quality, metadata, target_level
+            )
+            return future.result()
+        except Exception as e:
+            logger.warning(f"Process pool conversion failed, converting in-process: {e}")
+            return self.convert(
+                input_file,
+                output_format=output_format,
+                quality=quality,
+                metadata=metadata,
+                target_level=target_level
+            )
+    
+    def get_loudness_target(self, config: dict) -> Optional[str]:
+        """
+        Get the loudness target implied by the audio processing settings
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            Target level in LUFS, or None if normalization is disabled
+        """
+        if config.get('loudness_normalization'):
+            return EBU_R128_LEVEL
+        if config.get('normalize_audio'):
+            return DEFAULT_LOUDNESS_LEVEL
+        return None
+    
+    def _convert_with_pyav(
+        self,
+        input_path: Path,
+        output_path: Path,
+        output_format: str,
+        quality: str,
+        metadata: Optional[dict] = None
+    ) -> bool:
+        """
+        Convert audio in-process using PyAV (libav bindings)
+        
+        Args:
+            input_path: Path to input audio file
+            output_path: Path to write the converted file
+            output_format: Target format (mp3, flac, etc.)
+            quality: Audio bitrate for lossy formats (e.g. 320k)
+            metadata: Optional tags to write to the output container
+            
+        Returns:
+            True if converted, False if the caller should fall back to ffmpeg
+        """
+        if av is None:
+            return False
+        
+        codec_spec = PYAV_CODECS.get(output_format.lower())
+        if not codec_spec or codec_spec[0] not in av.codecs_available:
+            return False
+        
+        codec_name, uses_bitrate, options = codec_spec
+        
+        try:
+            with av.open(str(input_path)) as container_in, av.open(str(output_path), 'w') as container_out:
+                stream_in = container_in.streams.audio[0]
+                
+                rate = stream_in.rate
+                if codec_name == 'libopus' and rate not in OPUS_RATES:
+                    rate = 48000
+                
+                stream_out = container_out.add_stream(codec_name, rate=rate)
+                stream_out.options = dict(options)
+                if uses_bitrate:
+                    stream_out.bit_rate = int(quality.lower().rstrip('k')) * 1000
+                
+                for key, value in (metadata or {}).items():
+                    if value:
+                        container_out.metadata[key] = str(value)
+                
+                for frame in container_in.decode(stream_in):
+                    frame.pts = None
+                    for packet in stream_out.encode(frame):
+                        container_out.mux(packet)
+                
+                # Flush the encoder
+                for packet in stream_out.encode(None):
+                    container_out.mux(packet)
+            
+            return True
+            
+        except Exception as e:
+            logger.warning(f"PyAV conversion failed, falling back to ffmpeg: {e}")
+            if output_path.exists() and output_path != input_path:
+                output_path.unlink()
+            return False
+    
+    def tag_file(self, file_path: str, metadata: dict) -> bool:
+        """
+        Write tags to an existing file without re-muxing the audio
+        
+        Uses mutagen to rewrite only the tag header; falls back to the
+        ffmpeg-based add_metadata if mutagen is unavailable or fails.
+        
+        Args:
+            file_path: Path to audio file
+            metadata: Tags (artist, title, album, date, track)
+            
+        Returns:
+            True if successful
+        """
+        if mutagen is not None:
+            try:
+                audio = mutagen.File(str(file_path), easy=True)
+                if audio is not None:
+                    if audio.tags is None:
+                        audio.add_tags()
+                    for key, value in metadata.items():
+                        if value:
+                            audio[MUTAGEN_TAG_KEYS.get(key, key)] = str(value)
+                    audio.save()
+                    logger.info(f"Added metadata to {file_path}")
+                    return True
+            except Exception as e:
+                logger.debug(f"mutagen could not tag {file_path}: {e}")
+        
+        return self.add_metadata(
+            file_path,
+            artist=metadata.get('artist'),
+            title=metadata.get('title'),
+            album=metadata.get('album'),
+            year=metadata.get('date'),
+            track_number=metadata.get('track')
+        )
+    
     def extract_metadata(self, file_path: str) -> dict:
         """
-        Extract metadata from audio file using ffprobe
+        Extract metadata from audio file using mutagen, falling back to ffprobe
         
         Args:
             file_path: Path to audio file
@@ -149,6 +445,10 @@ class AudioConverter:
         Returns:
             Dict with metadata
         """
+        metadata = self._extract_metadata_mutagen(file_path)
+        if metadata:
+            return metadata
+        
         try:
             cmd = [
                 'ffprobe',
@@ -167,8 +467,7 @@ class AudioConverter:
             )
             
             if result.returncode == 0:
-                import json
-                return json.loads(result.stdout)
+                return orjson.loads(result.stdout)
             else:
                 logger.warning(f"Could not extract metadata from {file_path}")
                 return {}
@@ -177,6 +476,43 @@ class AudioConverter:
             logger.error(f"Error extracting metadata: {e}")
             return {}
     
+    def _extract_metadata_mutagen(self, file_path: str) -> dict:
+        """
+        Read duration, bitrate and tags in-process with mutagen
+        
+        Args:
+            file_path: Path to audio file
+            
+        Returns:
+            Dict shaped like ffprobe's format section, or empty dict if
+            mutagen is unavailable or cannot parse the file
+        """
+        if mutagen is None:
+            return {}
+        
+        try:
+            audio = mutagen.File(str(file_path), easy=True)
+            if audio is None:
+                return {}
+            
+            tags = {
+                key: ', '.join(str(v) for v in value) if isinstance(value, list) else str(value)
+                for key, value in (audio.tags or {}).items()
+            }
+            
+            return {
+                'format': {
+                    'filename': str(file_path),
+                    'duration': str(audio.info.length),
+                    'bit_rate': str(getattr(audio.info, 'bitrate', 0) or 0),
+                    'tags': tags
+                }
+            }
+            
+        except Exception as e:
+            logger.debug(f"mutagen could not read {file_path}: {e}")
+            return {}
+    
     def add_metadata(
         self,
         file_path: str,
@@ -201,96 +537,221 @@ class AudioConverter:
             True if successful
         """
         try:
-            input_path = Path(file_path)
-            temp_path = input_path.with_suffix('.temp' + input_path.suffix)
-            
-            cmd = [
-                'ffmpeg',
-                '-i', str(input_path),
-                '-y',
-                '-codec', 'copy'
-            ]
+            args = ['-codec', 'copy']
             
             # Add metadata
             if artist:
-                cmd.extend(['-metadata', f'artist={artist}'])
+                args.extend(['-metadata', f'artist={artist}'])
             if title:
-                cmd.extend(['-metadata', f'title={title}'])
+                args.extend(['-metadata', f'title={title}'])
             if album:
-                cmd.extend(['-metadata', f'album={album}'])
+                args.extend(['-metadata', f'album={album}'])
             if year:
-                cmd.extend(['-metadata', f'date={year}'])
+                args.extend(['-metadata', f'date={year}'])
             if track_number:
-                cmd.extend(['-metadata', f'track={track_number}'])
+                args.extend(['-metadata', f'track={track_number}'])
             
-            cmd.append(str(temp_path))
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            result = self._rewrite_in_place(Path(file_path), args, timeout=60)
             
             if result.returncode == 0:
-                # Replace original file with temp file
-                temp_path.replace(input_path)
                 logger.info(f"Added metadata to {file_path}")
                 return True
             else:
                 logger.error(f"Failed to add metadata: {result.stderr}")
-                if temp_path.exists():
-                    temp_path.unlink()
                 return False
                 
         except Exception as e:
             logger.error(f"Error adding metadata: {e}")
             return False
     
-    def normalize_audio(self, file_path: str, target_level: str = '-14.0') -> bool:
+    def normalize_audio(
+        self,
+        file_path: str,
+        target_level: str = DEFAULT_LOUDNESS_LEVEL,
+        quality: str = '320k'
+    ) -> bool:
         """
         Normalize audio levels
         
+        The file is re-encoded in its own format at the given quality (not
+        ffmpeg's default bitrate) and kept at its original sample rate.
+        
         Args:
             file_path: Path to audio file
             target_level: Target loudness level in LUFS
+            quality: Audio bitrate for lossy formats (e.g. 320k)
             
         Returns:
             True if successful
         """
         try:
-            input_path = Path(file_path)
-            temp_path = input_path.with_suffix('.temp' + input_path.suffix)
-            
-            cmd = [
-                'ffmpeg',
-                '-i', str(input_path),
-                '-af', f'loudnorm=I={target_level}:TP=-1.5:LRA=11',
-                '-y',
-                str(temp_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
+            path = Path(file_path)
+            output_format = path.suffix[1:].lower()
+            result = self._rewrite_in_place(
+                path,
+                [
+                    *self._encoder_args(output_format, quality),
+                    *self._loudnorm_args(path, output_format, target_level)
+                ],
                 timeout=300
             )
             
             if result.returncode == 0:
-                temp_path.replace(input_path)
                 logger.info(f"Normalized audio: {file_path}")
                 return True
             else:
                 logger.error(f"Failed to normalize audio: {result.stderr}")
-                if temp_path.exists():
-                    temp_path.unlink()
                 return False
                 
         except Exception as e:
             logger.error(f"Error normalizing audio: {e}")
             return False
     
+    def _encoder_args(self, output_format: str, quality: str) -> list:
+        """
+        Get ffmpeg encoder arguments for an output format
+        
+        Args:
+            output_format: Target format (mp3, flac, etc.)
+            quality: Audio bitrate for lossy formats (e.g. 320k)
+            
+        Returns:
+            List of ffmpeg arguments
+        """
+        codec_args = FFMPEG_CODEC_ARGS.get(output_format, ('-b:a', '{quality}'))
+        return [arg.format(quality=quality) for arg in codec_args]
+    
+    def _loudnorm_args(self, input_path: Path, output_format: str, target_level: str) -> list:
+        """
+        Get ffmpeg arguments for loudness normalization
+        
+        loudnorm resamples to 192 kHz internally, so the source sample rate
+        is set back explicitly (libopus only accepts its own set of rates).
+        
+        Args:
+            input_path: File being normalized (its sample rate is kept)
+            output_format: Target format (mp3, flac, etc.)
+            target_level: Target loudness level in LUFS
+            
+        Returns:
+            List of ffmpeg arguments
+        """
+        args = ['-af', LOUDNORM_FILTER.format(target_level=target_level)]
+        rate = self._sample_rate(input_path)
+        if output_format == 'opus' and rate not in OPUS_RATES:
+            rate = 48000
+        if rate:
+            args.extend(['-ar', str(rate)])
+        return args
+    
+    def _sample_rate(self, file_path: Path) -> Optional[int]:
+        """
+        Read a file's sample rate with mutagen, falling back to ffprobe
+        
+        Args:
+            file_path: Path to audio file
+            
+        Returns:
+            Sample rate in Hz, or None if it can't be determined
+        """
+        if mutagen is not None:
+            try:
+                audio = mutagen.File(str(file_path))
+                rate = getattr(getattr(audio, 'info', None), 'sample_rate', None)
+                if rate:
+                    return int(rate)
+            except Exception as e:
+                logger.debug(f"mutagen could not read {file_path}: {e}")
+        
+        try:
+            result = subprocess.run(
+                [
+                    'ffprobe', '-v', 'error',
+                    '-select_streams', 'a:0',
+                    '-show_entries', 'stream=sample_rate',
+                    '-of', 'default=noprint_wrappers=1:nokey=1',
+                    str(file_path)
+                ],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            if result.returncode == 0 and result.stdout.strip().isdigit():
+                return int(result.stdout.strip())
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.debug(f"ffprobe could not read {file_path}: {e}")
+        return None
+    
+    def _muxer_args(self, path: Path) -> list:
+        """
+        Get explicit ffmpeg muxer arguments for an output file
+        
+        Args:
+            path: Output file path
+            
+        Returns:
+            List of ffmpeg arguments (empty for unknown extensions)
+        """
+        extension = path.suffix[1:].lower()
+        muxer = FFMPEG_MUXERS.get(extension)
+        if not muxer:
+            return []
+        
+        args = ['-f', muxer]
+        if extension == 'm4a':
+            args.extend(['-movflags', '+faststart'])
+        return args
+    
+    def _rewrite_in_place(self, input_path: Path, args: list, timeout: int) -> subprocess.CompletedProcess:
+        """
+        Run ffmpeg over a file and atomically replace it with the result
+        
+        The output goes to a unique temp file in the same directory, which is
+        renamed over the original on success and removed otherwise.
+        
+        Args:
+            input_path: File to rewrite
+            args: ffmpeg output arguments (codec, filters, metadata)
+            timeout: Timeout in seconds
+            
+        Returns:
+            Completed ffmpeg process
+        """
+        fd, temp_name = tempfile.mkstemp(dir=str(input_path.parent), prefix='.blissful-', suffix=input_path.suffix)
+        os.close(fd)
+        
+        cmd = [
+            'ffmpeg',
+            *FFMPEG_QUIET_ARGS,
+            '-i', str(input_path),
+            '-y',
+            *args,
+            *self._muxer_args(input_path),
+            temp_name
+        ]
+        
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(temp_name)
+            raise
+        
+        if result.returncode == 0:
+            # mkstemp creates 0600 files - keep the original's permissions
+            shutil.copymode(input_path, temp_name)
+            os.replace(temp_name, input_path)
+        else:
+            with suppress(FileNotFoundError):
+                os.unlink(temp_name)
+        
+        return result
+    
     def get_supported_formats(self) -> list:
         """
         Get list of supported output formats
@@ -3,140 +3,681 @@ Authentication Manager for Blissful
 Handles authentication with Jellyfin, Emby, and Plex
 """
 
+import hashlib
 import logging
+import random
+import secrets
+import threading
+import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from types import MappingProxyType
+from urllib.parse import urlencode, urlparse
 import requests as req
+from requests.adapters import HTTPAdapter
+
+from .circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
+# Per-backend concurrency limits ("bulkheads"): each backend gets its own
+# session/connection pool and semaphore, so a burst of logins against a slow
+# backend can't take every slot and stall logins for the others
+BACKEND_MAX_CONCURRENT = {
+    'jellyfin': 20,
+    'emby': 20,
+    'plex': 20
+}
+# Seconds to wait for a free slot before rejecting the login
+BULKHEAD_WAIT = 2
+
+
+class BackendSaturated(Exception):
+    """Raised when a backend has no free request slots"""
+
+
+def _make_session(pool_size):
+    """
+    Create a session that reuses keep-alive connections (no TCP + TLS
+    handshake per login)
+    
+    Args:
+        pool_size: Max pooled connections per host
+        
+    Returns:
+        requests.Session: Configured session
+    """
+    session = req.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSIONS = {backend: _make_session(size) for backend, size in BACKEND_MAX_CONCURRENT.items()}
+_BULKHEADS = {backend: threading.BoundedSemaphore(size) for backend, size in BACKEND_MAX_CONCURRENT.items()}
+
+# Client identification sent with every Plex.tv call, set once on the session
+_SESSIONS['plex'].headers.update({
+    'X-Plex-Client-Identifier': 'blissful-web',
+    'X-Plex-Product': 'Blissful',
+    'X-Plex-Version': '1.0.0'
+})
+
+# Retries for transient backend failures (502/503/504, timeouts, dropped
+# connections). 4xx responses are never retried - a bad password or bad
+# config won't fix itself. Sleeps use exponential backoff with full jitter.
+# A POST that timed out waiting for the response may have been processed,
+# so it is only retried when it never got through (connect failures).
+# No retry starts unless it can finish within AUTH_RETRY_BUDGET seconds.
+AUTH_MAX_RETRIES = 2
+AUTH_RETRY_BUDGET = 30
+AUTH_RETRY_STATUSES = frozenset({502, 503, 504})
+AUTH_BACKOFF_BASE = 0.3
+AUTH_BACKOFF_CAP = 2.0
+
+
+def _request_with_retry(backend, method, url, **kwargs):
+    """
+    Send a request on the backend's session, retrying transient failures
+    
+    Args:
+        backend: Backend name (jellyfin, emby, plex)
+        method: HTTP method ('GET', 'POST')
+        url: Request URL
+        **kwargs: Passed through to requests
+        
+    Returns:
+        requests.Response: The last response received
+        
+    Raises:
+        BackendSaturated: If no request slot freed up within BULKHEAD_WAIT
+        requests.exceptions.Timeout / ConnectionError: If every attempt failed
+    """
+    bulkhead = _BULKHEADS[backend]
+    if not bulkhead.acquire(timeout=BULKHEAD_WAIT):
+        raise BackendSaturated(backend)
+    try:
+        return _send_with_retry(_SESSIONS[backend], method, url, **kwargs)
+    finally:
+        bulkhead.release()
+
+
+def _send_with_retry(session, method, url, **kwargs):
+    """
+    Send a request, retrying transient failures with jittered backoff
+    
+    Args:
+        session: requests.Session to send on
+        method: HTTP method
+        url: Request URL
+        **kwargs: Passed through to requests
+        
+    Returns:
+        requests.Response: The last response received
+    """
+    timeout = kwargs.get('timeout') or 0
+    attempt_time = sum(timeout) if isinstance(timeout, tuple) else timeout
+    deadline = time.monotonic() + AUTH_RETRY_BUDGET
+    
+    def can_retry(attempt, delay):
+        return attempt < AUTH_MAX_RETRIES and time.monotonic() + delay + attempt_time <= deadline
+    
+    for attempt in range(AUTH_MAX_RETRIES + 1):
+        delay = random.uniform(0, min(AUTH_BACKOFF_CAP, AUTH_BACKOFF_BASE * 2 ** attempt))
+        try:
+            response = session.request(method, url, **kwargs)
+        except req.exceptions.SSLError:
+            raise
+        except (req.exceptions.Timeout, req.exceptions.ConnectionError) as e:
+            # ReadTimeout means the request was sent; replaying a POST could
+            # repeat it (ConnectTimeout is a ConnectionError, so still retried)
+            sent = isinstance(e, req.exceptions.ReadTimeout)
+            if (sent and method.upper() == 'POST') or not can_retry(attempt, delay):
+                raise
+            logger.warning("%s %s failed (%s), retrying", method, url, type(e).__name__)
+        else:
+            if response.status_code not in AUTH_RETRY_STATUSES:
+                return response
+            # Honour Retry-After (plex.tv sends it on 503s), within the backoff cap
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = max(delay, min(AUTH_BACKOFF_CAP, int(retry_after)))
+            if not can_retry(attempt, delay):
+                return response
+            logger.warning("%s %s returned %d, retrying", method, url, response.status_code)
+        time.sleep(delay)
+
+
+@lru_cache(maxsize=8)
+def _emby_auth_headers(api_key):
+    """
+    Build the Jellyfin/Emby auth headers for an API key
+    
+    Cached per key, so logins don't rebuild the header string every time.
+    The result is read-only because it is shared between requests.
+    
+    Args:
+        api_key: Admin API key from config
+        
+    Returns:
+        MappingProxyType: Request headers
+    """
+    return MappingProxyType({
+        'Content-Type': 'application/json',
+        'X-Emby-Token': api_key,
+        'X-Emby-Authorization': f'MediaBrowser Client="Blissful", Device="Web", DeviceId="blissful-web", Version="1.0.0", Token="{api_key}"'
+    })
+
+
+# Fixed failure results, shared read-only; _error() hands out a copy
+# because routes pop 'status_code' before responding
+_ERR_CREDENTIALS_REQUIRED = MappingProxyType({'success': False, 'error': 'Username and password required', 'status_code': 400})
+_ERR_CREDENTIALS_TOO_LONG = MappingProxyType({'success': False, 'error': 'Username or password too long', 'status_code': 400})
+_ERR_NO_BACKEND_ENABLED = MappingProxyType({'success': False, 'error': 'No authentication method is enabled', 'status_code': 400})
+_ERR_INVALID_CREDENTIALS = MappingProxyType({'success': False, 'error': 'Invalid username or password', 'status_code': 401})
+_ERR_SSL = MappingProxyType({'success': False, 'error': 'SSL/HTTPS error. Contact admin.', 'status_code': 500})
+_ERR_TIMEOUT = MappingProxyType({'success': False, 'error': 'Server timeout. Please try again.', 'status_code': 504})
+_ERR_PLEX_UNCONFIGURED = MappingProxyType({'success': False, 'error': 'Plex server URL not configured. Contact admin.', 'status_code': 400})
+_ERR_PLEX_NO_TOKEN = MappingProxyType({'success': False, 'error': 'Failed to get user auth token', 'status_code': 500})
+_ERR_PLEX_VERIFY_FAILED = MappingProxyType({'success': False, 'error': 'Could not verify server access', 'status_code': 500})
+_ERR_PLEX_NO_ACCESS = MappingProxyType({'success': False, 'error': 'You do not have access to this Plex server. Contact the administrator.', 'status_code': 403})
+_ERR_PLEX_VERIFY_TIMEOUT = MappingProxyType({'success': False, 'error': 'Timeout verifying server access', 'status_code': 504})
+_ERR_PLEX_UNREACHABLE = MappingProxyType({'success': False, 'error': 'Cannot connect to Plex servers', 'status_code': 503})
+
+
+def _error(template):
+    """
+    Copy a failure template into a result dict
+    
+    Args:
+        template: One of the _ERR_* templates
+        
+    Returns:
+        dict: Authentication failure result
+    """
+    return dict(template)
+
+
+# Fraction of successful logins that get logged (failures always are)
+AUTH_LOG_SAMPLE_RATE = 0.01
+
+def _plex_target(server_url):
+    """
+    Host and port to look for among a user's Plex.tv resources
+    
+    Args:
+        server_url: Configured Plex URL, e.g. "http://192.168.1.100:32400"
+            or "https://plex.example.com" (scheme optional)
+        
+    Returns:
+        Tuple of (lowercased host, port string)
+    """
+    parsed = urlparse(server_url if '://' in server_url else f'//{server_url}')
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    return (parsed.hostname or '').lower(), str(port) if port else PLEX_DEFAULT_PORT
+
+
+def _connection_hosts(conn):
+    """
+    Get the hostnames a Plex.tv resource connection answers on
+    
+    Args:
+        conn: Connection entry from /api/v2/resources
+        
+    Returns:
+        set: Lowercased URI hostname and address
+    """
+    return {
+        (urlparse(conn.get('uri', '')).hostname or '').lower(),
+        conn.get('address', '').lower()
+    }
+
+
+# Credentials longer than this are rejected without contacting a backend
+MAX_USERNAME_LENGTH = 255
+MAX_PASSWORD_LENGTH = 1024
+
+
+def _reject_credentials(username, password):
+    """
+    Cheap sanity check run before any config lookup or network call
+    
+    Args:
+        username: Username from the request
+        password: Password from the request
+        
+    Returns:
+        dict: Failure result if the credentials can't be valid, else None
+    """
+    if not isinstance(username, str) or not isinstance(password, str) or not username or not password:
+        return _error(_ERR_CREDENTIALS_REQUIRED)
+    if len(username) > MAX_USERNAME_LENGTH or len(password) > MAX_PASSWORD_LENGTH:
+        return _error(_ERR_CREDENTIALS_TOO_LONG)
+    return None
+
+
+# How long a successful login is served from memory (seconds)
+AUTH_CACHE_TTL = 300
+# How long a rejected username/password pair is answered locally with 401,
+# so brute-force retries don't each cost a backend password check
+FAILED_AUTH_TTL = 60
+# Entries kept before expired ones are purged (oldest dropped if still full)
+AUTH_CACHE_MAX_ENTRIES = 10000
+
+# Consecutive backend failures (5xx, timeouts, connection errors) before
+# logins fail fast, and how long to wait before trying the backend again
+BACKEND_FAILURE_THRESHOLD = 5
+BACKEND_COOLDOWN = 30
+
+PLEX_TV_HOST = 'plex.tv'
+PLEX_SIGN_IN_URL = 'https://plex.tv/users/sign_in.json'
+# Older v2/resources endpoint, with relay and HTTPS connections included
+PLEX_RESOURCES_URL = 'https://plex.tv/api/v2/resources?includeHttps=1&includeRelay=1'
+PLEX_DEFAULT_PORT = '32400'
+
+# Backends that speak the Emby authentication API
+BACKEND_NAMES = {
+    'jellyfin': 'Jellyfin',
+    'emby': 'Emby'
+}
+
+# (connect, read) timeouts used when not set in config. Connect fails fast
+# for unreachable hosts; read leaves room for slow but healthy logins.
+DEFAULT_TIMEOUTS = {
+    'jellyfin': (3.05, 10),
+    'emby': (3.05, 10),
+    'plex': (3.05, 7)
+}
+
 
 class AuthManager:
     """Manages user authentication for request system"""
     
     def __init__(self, config_manager):
         self.config_manager = config_manager
+        
+        # Login results keyed by backend/server/user/keyed-hash(password).
+        # The pepper is per-process so cache keys never reveal passwords.
+        self._auth_cache = {}
+        self._auth_cache_lock = threading.Lock()
+        self._auth_pepper = secrets.token_bytes(32)
+        
+        # Circuit breakers keyed by backend URL
+        self._breakers = {}
+        self._breakers_lock = threading.Lock()
+        
+        # Validated per-backend settings as (config version, settings)
+        self._settings = {}
+        
+        # Runs logins off the request thread (authenticate_async/any)
+        self._auth_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix='auth')
+        
+        if self.config_manager.get_setting('enable_plex', False):
+            self._auth_executor.submit(self._prewarm_plex)
     
-    def authenticate_jellyfin(self, username, password):
+    def _prewarm_plex(self):
         """
-        Authenticate with Jellyfin using admin's API key from config
+        Open the pooled plex.tv connection ahead of the first Plex login, so
+        neither sign-in nor the resources lookup pays for DNS and the TLS handshake
+        """
+        try:
+            _SESSIONS['plex'].head(f'https://{PLEX_TV_HOST}/', timeout=DEFAULT_TIMEOUTS['plex'])
+        except req.exceptions.RequestException as e:
+            logger.debug("Could not pre-warm plex.tv connection: %s", e)
+    
+    def authenticate_async(self, backend, username, password):
+        """
+        Start a login in the background
         
         Args:
-            username: User's Jellyfin username
-            password: User's Jellyfin password
+            backend: Backend name (jellyfin, emby, plex)
+            username: Username
+            password: Password
             
         Returns:
-            dict: Authentication result with success status and user data
+            Future: Resolves to the authenticate_<backend> result dict
+            
+        Raises:
+            ValueError: If the backend is unknown
         """
-        try:
-            config = self.config_manager.get_config()
-            jellyfin_url = config.get('jellyfin_url', '').strip()
-            jellyfin_api_key = config.get('jellyfin_api_key', '').strip()
+        if backend not in BACKEND_MAX_CONCURRENT:
+            raise ValueError(f"Unknown auth backend: {backend}")
+        return self._auth_executor.submit(getattr(self, f'authenticate_{backend}'), username, password)
+    
+    def authenticate_any(self, username, password):
+        """
+        Try all enabled backends in parallel and return the first success
+        
+        Args:
+            username: Username
+            password: Password
             
-            logger.info(f"Attempting Jellyfin authentication for user: {username}")
-            logger.info(f"Jellyfin URL: {jellyfin_url}")
-            logger.info(f"API key configured: {'Yes' if jellyfin_api_key else 'No'}")
+        Returns:
+            dict: First successful result (with 'backend' set), otherwise
+                the failure from the first enabled backend
+        """
+        rejected = _reject_credentials(username, password)
+        if rejected:
+            return rejected
+        
+        backends = [b for b in BACKEND_MAX_CONCURRENT if self.config_manager.get_setting(f'enable_{b}', False)]
+        if not backends:
+            return _error(_ERR_NO_BACKEND_ENABLED)
+        
+        futures = {self.authenticate_async(b, username, password): b for b in backends}
+        failures = {}
+        for future in as_completed(futures):
+            backend = futures[future]
+            result = future.result()
+            if result.get('success'):
+                result['backend'] = backend
+                # Logins still queued are no longer needed; ones already
+                # running finish in the background (and fill the auth cache)
+                for pending in futures:
+                    pending.cancel()
+                return result
+            failures[backend] = result
+        return failures[backends[0]]
+    
+    def _auth_cache_key(self, backend, server_url, username, password):
+        """
+        Build the auth cache key without storing the raw password
+        
+        Args:
+            backend: Backend name (jellyfin, emby, plex)
+            server_url: Configured server URL
+            username: Username
+            password: Password
             
-            # Validate configuration
-            if not jellyfin_url:
-                return {
-                    'success': False,
-                    'error': 'Jellyfin not configured. Contact admin.',
-                    'status_code': 400
-                }
+        Returns:
+            tuple: Cache key
+        """
+        digest = hashlib.blake2b(password.encode('utf-8'), digest_size=16, key=self._auth_pepper).digest()
+        return (backend, server_url, username, digest)
+    
+    def _get_cached_auth(self, key):
+        """
+        Get a cached login result (success, or a recent 401)
+        
+        Args:
+            key: Cache key from _auth_cache_key
             
-            if not jellyfin_api_key:
-                return {
-                    'success': False,
-                    'error': 'Jellyfin API key not configured. Admin must add API key in Request settings.',
-                    'status_code': 400
+        Returns:
+            dict: Copy of the cached result, or None if missing/expired
+        """
+        with self._auth_cache_lock:
+            entry = self._auth_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if time.monotonic() >= expires_at:
+                del self._auth_cache[key]
+                return None
+            return dict(result)
+    
+    def _cache_auth(self, key, result, ttl=AUTH_CACHE_TTL):
+        """
+        Cache a login result (successes, and 401s with FAILED_AUTH_TTL)
+        
+        Args:
+            key: Cache key from _auth_cache_key
+            result: Authentication result
+            ttl: Seconds to keep the result
+        """
+        now = time.monotonic()
+        with self._auth_cache_lock:
+            if len(self._auth_cache) >= AUTH_CACHE_MAX_ENTRIES:
+                self._auth_cache = {
+                    k: entry for k, entry in self._auth_cache.items()
+                    if entry[0] > now
                 }
+                while len(self._auth_cache) >= AUTH_CACHE_MAX_ENTRIES:
+                    del self._auth_cache[next(iter(self._auth_cache))]
+            self._auth_cache[key] = (now + ttl, dict(result))
+    
+    def invalidate(self, access_token, backend=None):
+        """
+        Drop cached logins for the user an access token belongs to (on logout)
+        
+        The token identifies the caller, so a client can only clear its own
+        user's entries, never someone else's.
+        
+        Args:
+            access_token: Access token returned by the caller's login
+            backend: Only drop entries for this backend, or None for all
             
-            if not username or not password:
-                return {
-                    'success': False,
-                    'error': 'Username and password required',
-                    'status_code': 400
-                }
+        Returns:
+            int: Number of entries removed
+        """
+        if not isinstance(access_token, str) or not access_token:
+            return 0
+        with self._auth_cache_lock:
+            identities = {
+                key[:3] for key, (_, result) in self._auth_cache.items()
+                if (backend is None or key[0] == backend)
+                and secrets.compare_digest(result.get('access_token') or '', access_token)
+            }
+            stale = [key for key in self._auth_cache if key[:3] in identities]
+            for key in stale:
+                del self._auth_cache[key]
+        return len(stale)
+    
+    def _invalid_credentials(self, cache_key):
+        """
+        Build the 401 result for rejected credentials and remember it
+        
+        Args:
+            cache_key: Cache key from _auth_cache_key
             
-            # Make authentication request
-            auth_url = f"{jellyfin_url.rstrip('/')}/Users/AuthenticateByName"
+        Returns:
+            dict: Authentication failure result
+        """
+        self._cache_auth(cache_key, _ERR_INVALID_CREDENTIALS, ttl=FAILED_AUTH_TTL)
+        return _error(_ERR_INVALID_CREDENTIALS)
+    
+    def _backend_timeout(self, config, backend):
+        """
+        Get the (connect, read) timeout for a backend
+        
+        Args:
+            config: Current configuration
+            backend: Backend name (jellyfin, emby, plex)
             
-            payload = {
-                'Username': username,
-                'Pw': password
-            }
+        Returns:
+            tuple: (connect, read) timeout in seconds
+        """
+        connect, read = DEFAULT_TIMEOUTS[backend]
+        return (
+            config.get(f'{backend}_timeout_connect', connect),
+            config.get(f'{backend}_timeout_read', read)
+        )
+    
+    def _tls_verify(self, config):
+        """
+        Get the requests `verify` value for Jellyfin/Emby
+        
+        Args:
+            config: Current configuration
             
-            # Use admin's API key in headers
-            headers = {
-                'Content-Type': 'application/json',
-                'X-Emby-Token': jellyfin_api_key,
-                'X-Emby-Authorization': f'MediaBrowser Client="Blissful", Device="Web", DeviceId="blissful-web", Version="1.0.0", Token="{jellyfin_api_key}"'
-            }
+        Returns:
+            bool or str: CA bundle path, True (system/certifi CAs) or False
+        """
+        if config.get('allow_self_signed', False):
+            # Logged when the settings are (re)built, i.e. once per config
+            # change; urllib3's InsecureRequestWarning stays on for other clients
+            logger.warning("TLS certificate verification is disabled for Jellyfin/Emby (allow_self_signed)")
+            return False
+        ca_bundle = config.get('ca_bundle', '')
+        return ca_bundle or True
+    
+    def _backend_settings(self, backend):
+        """
+        Get a backend's validated settings, rebuilt only when config changes
+        
+        Args:
+            backend: Backend name (jellyfin, emby, plex)
             
-            try:
-                response = req.post(auth_url, json=payload, headers=headers, timeout=30, verify=False)
-                
-                logger.info(f"Jellyfin response status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    auth_data = response.json()
-                    access_token = auth_data.get('AccessToken')
-                    user_data = auth_data.get('User', {})
-                    
-                    logger.info(f"✅ Authentication successful for user: {username}")
-                    
-                    return {
-                        'success': True,
-                        'access_token': access_token,
-                        'username': user_data.get('Name'),
-                        'user_id': user_data.get('Id'),
-                        'status_code': 200
-                    }
-                elif response.status_code == 401:
-                    logger.warning(f"❌ Invalid credentials for user: {username}")
-                    return {
-                        'success': False,
-                        'error': 'Invalid username or password',
-                        'status_code': 401
-                    }
-                else:
-                    logger.error(f"❌ Jellyfin error {response.status_code}: {response.text[:200]}")
-                    return {
-                        'success': False,
-                        'error': f'Jellyfin server error ({response.status_code}). Please try again or contact admin.',
-                        'status_code': 500
-                    }
-                    
-            except req.exceptions.Timeout:
-                logger.error(f"Jellyfin server timeout at {jellyfin_url}")
-                return {
-                    'success': False,
-                    'error': 'Server timeout. Please try again.',
-                    'status_code': 504
-                }
-                
-            except req.exceptions.ConnectionError as e:
-                logger.error(f"Cannot connect to Jellyfin: {e}")
-                return {
-                    'success': False,
-                    'error': 'Cannot connect to Jellyfin server',
-                    'status_code': 503
-                }
-                
-            except req.exceptions.SSLError as e:
-                logger.error(f"SSL error: {e}")
-                return {
-                    'success': False,
-                    'error': 'SSL/HTTPS error. Contact admin.',
-                    'status_code': 500
-                }
-                
-        except Exception as e:
-            logger.error(f"Jellyfin authentication error: {e}", exc_info=True)
-            return {
+        Returns:
+            dict: Settings; 'error' holds the failure result if misconfigured
+        """
+        version = self.config_manager.get_version()
+        cached = self._settings.get(backend)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        settings = self._build_backend_settings(self.config_manager.get_config(), backend)
+        self._settings[backend] = (version, settings)
+        return settings
+    
+    def _build_backend_settings(self, config, backend):
+        """
+        Read and validate a backend's settings from config
+        
+        Args:
+            config: Current configuration
+            backend: Backend name (jellyfin, emby, plex)
+            
+        Returns:
+            dict: Settings for the backend
+        """
+        # URLs and keys arrive normalized from ConfigManager (stripped, no trailing slash)
+        server_url = config.get(f'{backend}_url', '')
+        settings = {
+            'server_url': server_url,
+            'timeout': self._backend_timeout(config, backend),
+            'error': None
+        }
+        
+        if backend == 'plex':
+            # Server identifier used to match the user's Plex.tv resources,
+            # parsed once per config version rather than on every login
+            match_host, match_port = _plex_target(server_url)
+            settings.update({'match_host': match_host, 'match_port': match_port})
+            if not server_url:
+                settings['error'] = _ERR_PLEX_UNCONFIGURED
+            return settings
+        
+        name = BACKEND_NAMES[backend]
+        api_key = config.get(f'{backend}_api_key', '')
+        settings.update({
+            'api_key_set': bool(api_key),
+            'auth_url': f"{server_url}/Users/AuthenticateByName",
+            'headers': _emby_auth_headers(api_key),
+            'verify': self._tls_verify(config)
+        })
+        
+        if not server_url:
+            settings['error'] = {
                 'success': False,
-                'error': f'Authentication error: {str(e)}',
-                'status_code': 500
+                'error': f'{name} not configured. Contact admin.',
+                'status_code': 400
             }
+        elif not api_key:
+            settings['error'] = {
+                'success': False,
+                'error': f'{name} API key not configured. Admin must add API key in Request settings.',
+                'status_code': 400
+            }
+        return settings
+    
+    def _backend_breaker(self, backend_url):
+        """
+        Get (or create) the circuit breaker for a backend
+        
+        Args:
+            backend_url: Backend server URL (or plex.tv)
+            
+        Returns:
+            CircuitBreaker: Breaker for the backend
+        """
+        key = backend_url.lower()
+        with self._breakers_lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(fail_max=BACKEND_FAILURE_THRESHOLD, reset_timeout=BACKEND_COOLDOWN)
+                self._breakers[key] = breaker
+            return breaker
+    
+    def _backend_unavailable(self, backend_name, backend_url):
+        """
+        Build the fail-fast result returned while a backend's breaker is open
+        
+        Args:
+            backend_name: Display name (Jellyfin, Emby, Plex)
+            backend_url: Backend server URL
+            
+        Returns:
+            dict: Authentication failure result
+        """
+        logger.warning("%s at %s is failing, skipping login attempt", backend_name, backend_url)
+        return {
+            'success': False,
+            'error': f'{backend_name} server is temporarily unavailable. Please try again shortly.',
+            'status_code': 503
+        }
+    
+    def _backend_saturated(self, backend_name):
+        """
+        Build the result returned when a backend has no free request slots
+        
+        Args:
+            backend_name: Display name (Jellyfin, Emby, Plex)
+            
+        Returns:
+            dict: Authentication failure result
+        """
+        logger.warning("Too many concurrent %s logins, rejecting", backend_name)
+        return {
+            'success': False,
+            'error': f'Too many {backend_name} logins in progress. Please try again shortly.',
+            'status_code': 503
+        }
+    
+    def _record_backend_status(self, breaker, backend_url, status_code):
+        """
+        Feed an HTTP response status into a backend's breaker
+        
+        Only 5xx counts as a failure; 4xx means the backend is up.
+        
+        Args:
+            breaker: Backend circuit breaker
+            backend_url: Backend server URL
+            status_code: HTTP status code
+        """
+        if status_code >= 500:
+            self._record_backend_failure(breaker, backend_url)
+        else:
+            breaker.record_success()
+    
+    def _record_backend_failure(self, breaker, backend_url):
+        """
+        Record a failed call to a backend
+        
+        Args:
+            breaker: Backend circuit breaker
+            backend_url: Backend server URL
+        """
+        if breaker.record_failure():
+            logger.warning("Backend %s failed %d times in a row, failing logins fast for %ds",
+                           backend_url, breaker.failures, BACKEND_COOLDOWN)
+    
+    def authenticate_jellyfin(self, username, password):
+        """
+        Authenticate with Jellyfin using admin's API key from config
+        
+        Args:
+            username: User's Jellyfin username
+            password: User's Jellyfin password
+            
+        Returns:
+            dict: Authentication result with success status and user data
+        """
+        return self._timed_auth('jellyfin', username, self._authenticate_emby_protocol, 'jellyfin', username, password)
     
     def authenticate_emby(self, username, password):
         """
@@ -149,112 +690,146 @@ class AuthManager:
         Returns:
             dict: Authentication result with success status and user data
         """
-        try:
-            config = self.config_manager.get_config()
-            emby_url = config.get('emby_url', '').strip()
-            emby_api_key = config.get('emby_api_key', '').strip()
+        return self._timed_auth('emby', username, self._authenticate_emby_protocol, 'emby', username, password)
+    
+    def _timed_auth(self, backend, username, auth_func, *args):
+        """
+        Run a login and emit one log record for it
+        
+        Failures are always logged; successes are sampled at
+        AUTH_LOG_SAMPLE_RATE. Backend, user, status and duration are also
+        attached as record attributes for structured handlers.
+        
+        Args:
+            backend: Backend name (jellyfin, emby, plex)
+            username: Username (logged, never the password)
+            auth_func: Login implementation
+            *args: Arguments for auth_func
+            
+        Returns:
+            dict: Result of auth_func
+        """
+        started = time.perf_counter()
+        result = auth_func(*args)
+        
+        success = result.get('success', False)
+        level = logging.INFO if success else logging.WARNING
+        if (success and random.random() >= AUTH_LOG_SAMPLE_RATE) or not logger.isEnabledFor(level):
+            return result
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        status = result.get('status_code', 200)
+        logger.log(
+            level, "auth backend=%s user=%s status=%s ms=%.1f%s",
+            backend, username, status, elapsed_ms,
+            '' if success else f" error={result.get('error')!r}",
+            extra={'backend': backend, 'user': username, 'status': status, 'ms': elapsed_ms}
+        )
+        return result
+    
+    def _authenticate_emby_protocol(self, backend, username, password):
+        """
+        Authenticate against a Jellyfin or Emby server (Jellyfin kept Emby's
+        AuthenticateByName API and X-Emby-* headers)
+        
+        Args:
+            backend: Backend name ('jellyfin' or 'emby'), used for config keys
+            username: User's username
+            password: User's password
             
-            logger.info(f"Attempting Emby authentication for user: {username}")
-            logger.info(f"Emby URL: {emby_url}")
-            logger.info(f"API key configured: {'Yes' if emby_api_key else 'No'}")
+        Returns:
+            dict: Authentication result with success status and user data
+        """
+        rejected = _reject_credentials(username, password)
+        if rejected:
+            return rejected
+        
+        name = BACKEND_NAMES[backend]
+        try:
+            settings = self._backend_settings(backend)
+            server_url = settings['server_url']
             
-            # Validate configuration
-            if not emby_url:
-                return {
-                    'success': False,
-                    'error': 'Emby not configured. Contact admin.',
-                    'status_code': 400
-                }
+            # Configuration is validated once per config change
+            if settings['error']:
+                return dict(settings['error'])
             
-            if not emby_api_key:
-                return {
-                    'success': False,
-                    'error': 'Emby API key not configured. Admin must add API key in Request settings.',
-                    'status_code': 400
-                }
+            cache_key = self._auth_cache_key(backend, server_url, username, password)
+            cached = self._get_cached_auth(cache_key)
+            if cached:
+                return cached
             
-            if not username or not password:
-                return {
-                    'success': False,
-                    'error': 'Username and password required',
-                    'status_code': 400
-                }
+            breaker = self._backend_breaker(server_url)
+            if not breaker.allow():
+                return self._backend_unavailable(name, server_url)
             
             # Make authentication request
-            auth_url = f"{emby_url.rstrip('/')}/Users/AuthenticateByName"
+            auth_url = settings['auth_url']
             
             payload = {
                 'Username': username,
                 'Pw': password
             }
             
-            # Use admin's API key in headers
-            headers = {
-                'Content-Type': 'application/json',
-                'X-Emby-Token': emby_api_key,
-                'X-Emby-Authorization': f'MediaBrowser Client="Blissful", Device="Web", DeviceId="blissful-web", Version="1.0.0", Token="{emby_api_key}"'
-            }
+            # Use admin's API key in headers (they also carry the JSON
+            # Content-Type for the orjson-encoded body)
+            headers = settings['headers']
             
             try:
-                response = req.post(auth_url, json=payload, headers=headers, timeout=30, verify=False)
+                response = _request_with_retry(backend, 'POST', auth_url, data=orjson.dumps(payload), headers=headers,
+                                               timeout=settings['timeout'], verify=settings['verify'])
                 
-                logger.info(f"Emby response status: {response.status_code}")
+                self._record_backend_status(breaker, server_url, response.status_code)
                 
                 if response.status_code == 200:
-                    auth_data = response.json()
+                    auth_data = orjson.loads(response.content)
                     access_token = auth_data.get('AccessToken')
                     user_data = auth_data.get('User', {})
                     
-                    logger.info(f"✅ Authentication successful for user: {username}")
-                    
-                    return {
+                    result = {
                         'success': True,
                         'access_token': access_token,
                         'username': user_data.get('Name'),
                         'user_id': user_data.get('Id'),
                         'status_code': 200
                     }
+                    self._cache_auth(cache_key, result)
+                    return result
                 elif response.status_code == 401:
-                    logger.warning(f"❌ Invalid credentials for user: {username}")
-                    return {
-                        'success': False,
-                        'error': 'Invalid username or password',
-                        'status_code': 401
-                    }
+                    return self._invalid_credentials(cache_key)
                 else:
-                    logger.error(f"❌ Emby error {response.status_code}: {response.text[:200]}")
+                    logger.error("❌ %s error %d", name, response.status_code)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Response body: %s", response.content[:200].decode('utf-8', 'replace'))
                     return {
                         'success': False,
-                        'error': f'Emby server error ({response.status_code})',
+                        'error': f'{name} server error ({response.status_code}). Please try again or contact admin.',
                         'status_code': 500
                     }
                     
+            except req.exceptions.SSLError as e:
+                logger.error("SSL error from %s: %s "
+                             "(set ca_bundle, or allow_self_signed for self-signed certificates)", name, e)
+                return _error(_ERR_SSL)
+                
             except req.exceptions.Timeout:
-                logger.error(f"Emby server timeout at {emby_url}")
-                return {
-                    'success': False,
-                    'error': 'Server timeout. Please try again.',
-                    'status_code': 504
-                }
+                self._record_backend_failure(breaker, server_url)
+                logger.error("%s server timeout at %s", name, server_url)
+                return _error(_ERR_TIMEOUT)
                 
             except req.exceptions.ConnectionError as e:
-                logger.error(f"Cannot connect to Emby: {e}")
+                self._record_backend_failure(breaker, server_url)
+                logger.error("Cannot connect to %s: %s", name, e)
                 return {
                     'success': False,
-                    'error': 'Cannot connect to Emby server',
+                    'error': f'Cannot connect to {name} server',
                     'status_code': 503
                 }
                 
-            except req.exceptions.SSLError as e:
-                logger.error(f"SSL error: {e}")
-                return {
-                    'success': False,
-                    'error': 'SSL/HTTPS error',
-                    'status_code': 500
-                }
-                
+        except BackendSaturated:
+            return self._backend_saturated(name)
+            
         except Exception as e:
-            logger.error(f"Emby authentication error: {e}", exc_info=True)
+            logger.error("%s authentication error: %s", name, e, exc_info=True)
             return {
                 'success': False,
                 'error': f'Authentication error: {str(e)}',
@@ -272,36 +847,45 @@ class AuthManager:
         Returns:
             dict: Authentication result with success status and user data
         """
+        return self._timed_auth('plex', username, self._authenticate_plex, username, password)
+    
+    def _authenticate_plex(self, username, password):
+        """
+        Sign in to Plex.tv and check the user can reach the configured server
+        
+        Args:
+            username: User's Plex username
+            password: User's Plex password
+            
+        Returns:
+            dict: Authentication result with success status and user data
+        """
+        rejected = _reject_credentials(username, password)
+        if rejected:
+            return rejected
+        
         try:
-            config = self.config_manager.get_config()
-            plex_server_url = config.get('plex_url', '').strip()
+            settings = self._backend_settings('plex')
+            plex_server_url = settings['server_url']
             
-            logger.info(f"Attempting Plex authentication for user: {username}")
-            logger.info(f"Plex server URL: {plex_server_url}")
+            # Configuration is validated once per config change
+            if settings['error']:
+                return dict(settings['error'])
             
-            # Validate configuration
-            if not plex_server_url:
-                return {
-                    'success': False,
-                    'error': 'Plex server URL not configured. Contact admin.',
-                    'status_code': 400
-                }
+            cache_key = self._auth_cache_key('plex', plex_server_url, username, password)
+            cached = self._get_cached_auth(cache_key)
+            if cached:
+                return cached
             
-            if not username or not password:
-                return {
-                    'success': False,
-                    'error': 'Username and password required',
-                    'status_code': 400
-                }
+            breaker = self._backend_breaker(PLEX_TV_HOST)
+            if not breaker.allow():
+                return self._backend_unavailable('Plex', PLEX_TV_HOST)
             
             # Step 1: Authenticate with Plex.tv
-            auth_url = "https://plex.tv/users/sign_in.json"
+            auth_url = PLEX_SIGN_IN_URL
             
             headers = {
-                'Content-Type': 'application/x-www-form-urlencoded',
-                'X-Plex-Client-Identifier': 'blissful-web',
-                'X-Plex-Product': 'Blissful',
-                'X-Plex-Version': '1.0.0'
+                'Content-Type': 'application/x-www-form-urlencoded'
             }
             
             payload = {
@@ -309,124 +893,78 @@ class AuthManager:
                 'user[password]': password
             }
             
-            response = req.post(auth_url, data=payload, headers=headers, timeout=10)
+            try:
+                response = _request_with_retry('plex', 'POST', auth_url, data=urlencode(payload), headers=headers,
+                                               timeout=settings['timeout'])
+            except (req.exceptions.Timeout, req.exceptions.ConnectionError):
+                self._record_backend_failure(breaker, PLEX_TV_HOST)
+                raise
+            self._record_backend_status(breaker, PLEX_TV_HOST, response.status_code)
+            
+            if response.status_code == 401:
+                return self._invalid_credentials(cache_key)
             
             if response.status_code != 201:
-                logger.warning(f"❌ Plex authentication failed for user: {username}")
-                return {
-                    'success': False,
-                    'error': 'Invalid username or password',
-                    'status_code': 401
-                }
+                logger.warning("❌ Plex authentication failed for user: %s (%d)", username, response.status_code)
+                return _error(_ERR_INVALID_CREDENTIALS)
             
-            auth_data = response.json()
+            auth_data = orjson.loads(response.content)
             user_data = auth_data.get('user', {})
             user_auth_token = user_data.get('authToken')
             
             if not user_auth_token:
-                return {
-                    'success': False,
-                    'error': 'Failed to get user auth token',
-                    'status_code': 500
-                }
-            
-            logger.info(f"✅ Plex.tv authentication successful for user: {username}")
+                return _error(_ERR_PLEX_NO_TOKEN)
             
             # Step 2: Verify user has access to the configured Plex server
-            logger.info(f"Verifying server access for {username}...")
             
             try:
                 # Get user's accessible servers from Plex.tv
-                # Use the older v2/resources endpoint with proper parameters
-                servers_url = "https://plex.tv/api/v2/resources?includeHttps=1&includeRelay=1"
+                servers_url = PLEX_RESOURCES_URL
                 servers_headers = {
                     'X-Plex-Token': user_auth_token,
-                    'Accept': 'application/json',
-                    'X-Plex-Client-Identifier': 'blissful-web',
-                    'X-Plex-Product': 'Blissful',
-                    'X-Plex-Version': '1.0.0'
+                    'Accept': 'application/json'
                 }
                 
-                servers_response = req.get(servers_url, headers=servers_headers, timeout=10)
+                servers_response = _request_with_retry('plex', 'GET', servers_url, headers=servers_headers,
+                                                      timeout=settings['timeout'])
                 
-                logger.info(f"Plex servers API response status: {servers_response.status_code}")
+                self._record_backend_status(breaker, PLEX_TV_HOST, servers_response.status_code)
                 
                 if servers_response.status_code != 200:
-                    logger.error(f"Failed to get user's servers: {servers_response.status_code}")
-                    logger.error(f"Response body: {servers_response.text[:500]}")
-                    return {
-                        'success': False,
-                        'error': 'Could not verify server access',
-                        'status_code': 500
-                    }
+                    logger.error("Failed to get user's servers: %d", servers_response.status_code)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Response body: %s", servers_response.content[:500].decode('utf-8', 'replace'))
+                    return _error(_ERR_PLEX_VERIFY_FAILED)
                 
-                servers = servers_response.json()
-                logger.info(f"Found {len(servers)} servers for user {username}")
+                servers = orjson.loads(servers_response.content)
+                logger.debug("Found %d Plex resources for user %s", len(servers), username)
                 
-                # Extract server identifier from configured URL
-                # plex_server_url could be like "http://192.168.1.100:32400" or "https://plex.example.com"
-                configured_host = plex_server_url.split('://')[-1].split(':')[0].lower()
-                configured_port = '32400'  # Default Plex port
-                if ':' in plex_server_url.split('://')[-1]:
-                    configured_port = plex_server_url.split(':')[-1].split('/')[0]
+                # Server identifier parsed from the configured URL
+                configured_host = settings['match_host']
+                configured_port = settings['match_port']
                 
-                logger.info(f"Looking for server matching host: {configured_host}, port: {configured_port}")
+                logger.debug("Looking for server matching host: %s, port: %s", configured_host, configured_port)
                 
-                # Check if user has access to a server matching our configuration
-                has_access = False
-                server_name = None
-                matched_server = None
+                # Check if user has access to a server matching our configuration.
+                # Hosts are compared exactly, so 192.168.1.5 no longer matches 192.168.1.50.
+                matched = next((
+                    (server, conn)
+                    for server in servers
+                    if server.get('provides') == 'server'  # not players or other devices
+                    for conn in server.get('connections', [])
+                    if configured_host in _connection_hosts(conn)
+                ), None)
                 
-                for server in servers:
-                    # Only check actual Plex Media Servers (not players or other devices)
-                    if server.get('provides') != 'server':
-                        continue
-                    
-                    server_name_check = server.get('name', '')
-                    connections = server.get('connections', [])
-                    
-                    logger.info(f"Checking server: {server_name_check} with {len(connections)} connections")
-                    
-                    for conn in connections:
-                        conn_uri = conn.get('uri', '').lower()
-                        conn_address = conn.get('address', '').lower()
-                        conn_local = conn.get('local', False)
-                        
-                        logger.debug(f"  Connection: {conn_uri} (address: {conn_address}, local: {conn_local})")
-                        
-                        # Check if this connection matches our configured server
-                        # Match by host/address
-                        if configured_host in conn_uri or configured_host in conn_address:
-                            has_access = True
-                            server_name = server_name_check
-                            matched_server = server
-                            logger.info(f"✅ Match found! Server: {server_name}, Connection: {conn_uri}")
-                            break
-                        
-                        # Also try matching the full URL
-                        if plex_server_url.lower() in conn_uri:
-                            has_access = True
-                            server_name = server_name_check
-                            matched_server = server
-                            logger.info(f"✅ Match found by full URL! Server: {server_name}")
-                            break
-                    
-                    if has_access:
-                        break
+                if matched is None:
+                    logger.warning("User %s has no access to %s (%d other server(s))", username, plex_server_url,
+                                   sum(1 for s in servers if s.get('provides') == 'server'))
+                    return _error(_ERR_PLEX_NO_ACCESS)
                 
-                if not has_access:
-                    logger.warning(f"❌ User {username} does not have access to the configured Plex server")
-                    logger.warning(f"Configured: {plex_server_url}")
-                    logger.warning(f"User has access to {len([s for s in servers if s.get('provides') == 'server'])} server(s)")
-                    return {
-                        'success': False,
-                        'error': 'You do not have access to this Plex server. Contact the administrator.',
-                        'status_code': 403
-                    }
+                matched_server, matched_conn = matched
+                server_name = matched_server.get('name', '')
+                logger.debug("Match found! Server: %s, Connection: %s", server_name, matched_conn.get('uri'))
                 
-                logger.info(f"✅ User {username} verified to have access to server: {server_name}")
-                
-                return {
+                result = {
                     'success': True,
                     'access_token': user_auth_token,
                     'username': user_data.get('username'),
@@ -434,24 +972,23 @@ class AuthManager:
                     'server_name': server_name,
                     'status_code': 200
                 }
+                self._cache_auth(cache_key, result)
+                return result
                 
             except req.exceptions.Timeout:
-                logger.error(f"Timeout checking Plex server access")
-                return {
-                    'success': False,
-                    'error': 'Timeout verifying server access',
-                    'status_code': 504
-                }
+                self._record_backend_failure(breaker, PLEX_TV_HOST)
+                logger.error("Timeout checking Plex server access")
+                return _error(_ERR_PLEX_VERIFY_TIMEOUT)
             except req.exceptions.ConnectionError as e:
-                logger.error(f"Cannot connect to Plex: {e}")
-                return {
-                    'success': False,
-                    'error': 'Cannot connect to Plex servers',
-                    'status_code': 503
-                }
+                self._record_backend_failure(breaker, PLEX_TV_HOST)
+                logger.error("Cannot connect to Plex: %s", e)
+                return _error(_ERR_PLEX_UNREACHABLE)
                 
+        except BackendSaturated:
+            return self._backend_saturated('Plex')
+            
         except Exception as e:
-            logger.error(f"Plex authentication error: {e}", exc_info=True)
+            logger.error("Plex authentication error: %s", e, exc_info=True)
             return {
                 'success': False,
                 'error': str(e),
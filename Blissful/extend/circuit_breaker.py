@@ -0,0 +1,85 @@
+"""
+Circuit Breaker for Blissful
+Skips calls to a failing upstream (download source, auth backend) for a
+cool-down period instead of waiting on it every time
+"""
+
+import threading
+import time
+from typing import Dict
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half-open)"""
+    
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30):
+        """
+        Initialize circuit breaker
+        
+        Args:
+            fail_max: Consecutive failures before the breaker opens
+            reset_timeout: Seconds to stay open before allowing a trial call
+        """
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """
+        Check whether a call may be attempted
+        
+        Returns:
+            True if closed, or if the cool-down elapsed (half-open trial)
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Half-open: let a trial through, one more failure re-opens
+                self._opened_at = None
+                self._failures = self.fail_max - 1
+                return True
+            return False
+    
+    def record_success(self):
+        """Record a successful call and close the breaker"""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+    
+    def record_failure(self) -> bool:
+        """
+        Record a failed call
+        
+        Returns:
+            True if this failure opened the breaker
+        """
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max and self._opened_at is None:
+                self._opened_at = time.monotonic()
+                return True
+            return False
+    
+    @property
+    def failures(self) -> int:
+        """Number of consecutive failures"""
+        return self._failures
+    
+    def status(self) -> Dict:
+        """
+        Get breaker state for health reporting
+        
+        Returns:
+            Dict with failure count and seconds until retry
+        """
+        with self._lock:
+            retry_in = 0
+            if self._opened_at is not None:
+                retry_in = max(0, round(self._opened_at + self.reset_timeout - time.monotonic()))
+            return {
+                'failures': self._failures,
+                'retry_in': retry_in
+            }
@@ -1,10 +1,164 @@
-import json
+import errno
+import hashlib
 import logging
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import suppress
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+LIDARR_API_KEY_KEEP = '***KEEP_EXISTING***'
+OUTPUT_FORMATS = frozenset({'mp3', 'flac', 'wav', 'ogg', 'opus', 'm4a', 'aac'})
+
+# update_setting calls within this many seconds are written to disk together
+SETTING_FLUSH_DELAY = 0.25
+
+
+def _url(value) -> str:
+    """URL without surrounding whitespace or trailing slash"""
+    return str(value).strip().rstrip('/')
+
+
+def _stripped(value) -> str:
+    """String without surrounding whitespace"""
+    return str(value).strip()
+
+
+def _lidarr_api_key(value) -> str:
+    """Lidarr API key, unless the UI asked to keep the existing one"""
+    # The UI sends a marker instead of the key it never received
+    if value == LIDARR_API_KEY_KEEP:
+        raise ValueError('keep existing key')
+    # Update with new value (even if empty string)
+    return str(value).strip()
+
+
+def _output_format(value) -> str:
+    """Lowercased output format, if supported"""
+    value = str(value).lower()
+    if value not in OUTPUT_FORMATS:
+        raise ValueError(f'unsupported format: {value}')
+    return value
+
+
+def _instance_of(kind):
+    """Coercer accepting only values of the given type, unchanged"""
+    def coerce(value):
+        if not isinstance(value, kind):
+            raise TypeError(f'expected {kind.__name__}')
+        return value
+    return coerce
+
+
+def _int_between(low, high):
+    """Coercer for integers within [low, high]"""
+    def coerce(value) -> int:
+        value = int(value)
+        if not low <= value <= high:
+            raise ValueError(f'{value} outside {low}-{high}')
+        return value
+    return coerce
+
+
+def _timeout(value) -> float:
+    """Timeout in seconds, above 0 and at most 120"""
+    value = float(value)
+    if not 0 < value <= 120:
+        raise ValueError(f'timeout {value} outside 0-120')
+    return value
+
+
+_URL_KEYS = ('lidarr_url', 'jellyfin_url', 'emby_url', 'plex_url')
+_STR_KEYS = ('quality', 'sample_rate', 'channels')
+_STRIPPED_KEYS = ('jellyfin_api_key', 'emby_api_key', 'ca_bundle')
+_BOOL_KEYS = (
+    'auto_cleanup', 'normalize_audio', 'mono_audio', 'remove_silence',
+    'loudness_normalization', 'embed_metadata', 'embed_thumbnail',
+    'enable_requests', 'auto_monitor_requests', 'enable_jellyfin', 'enable_emby',
+    'enable_plex', 'allow_self_signed', 'request_default_monitored', 'request_search_missing'
+)
+_TIMEOUT_KEYS = tuple(
+    f'{backend}_timeout_{kind}'
+    for backend in ('jellyfin', 'emby', 'plex')
+    for kind in ('connect', 'read')
+)
+
+# Setting -> coercer. A coercer raises ValueError/TypeError to reject a value.
+_VALIDATORS = {
+    **{key: _url for key in _URL_KEYS},
+    **{key: str for key in _STR_KEYS},
+    **{key: _stripped for key in _STRIPPED_KEYS},
+    **{key: bool for key in _BOOL_KEYS},
+    **{key: _timeout for key in _TIMEOUT_KEYS},
+    'lidarr_api_key': _lidarr_api_key,
+    'output_format': _output_format,
+    'lidarr_path_mapping': _instance_of(dict),
+    'source_priorities': _instance_of(list),
+    'microservice_port': _int_between(1, 65535),
+    'album_concurrency': _int_between(1, 16),
+}
+
+
+# Built once; _get_default_config and _load_config copy it shallowly, so
+# the nested list/dicts are shared and must be treated as read-only
+_DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType({
+    'lidarr_url': '',
+    'lidarr_api_key': '',
+    'output_format': 'mp3',
+    'quality': '320k',
+    'lidarr_path_mapping': {},
+    'microservice_port': 5000,
+    'auto_cleanup': True,
+    'normalize_audio': False,
+    'mono_audio': False,
+    'sample_rate': 'original',
+    'remove_silence': False,
+    'loudness_normalization': False,
+    'channels': 'original',
+    'embed_metadata': True,
+    'embed_thumbnail': True,
+    'album_concurrency': 4,
+    'source_priorities': [
+        {'name': 'YouTube Music', 'search': 'music.youtube.com', 'enabled': True},
+        {'name': 'SoundCloud', 'search': 'soundcloud.com', 'enabled': True},
+        {'name': 'YouTube', 'search': 'youtube.com', 'enabled': True},
+        {'name': 'Bandcamp', 'search': 'bandcamp.com', 'enabled': True},
+        {'name': 'Spotify', 'search': 'spotify.com', 'enabled': True}
+    ],
+    # Request system defaults
+    'enable_requests': False,
+    'auto_monitor_requests': False,
+    'enable_jellyfin': False,
+    'jellyfin_url': '',
+    'jellyfin_api_key': '',
+    'enable_emby': False,
+    'emby_url': '',
+    'emby_api_key': '',
+    # TLS verification for Jellyfin/Emby (ca_bundle: path to a PEM
+    # file for private CAs; allow_self_signed skips verification)
+    'ca_bundle': '',
+    'allow_self_signed': False,
+    'enable_plex': False,
+    'plex_url': '',
+    # Auth backend timeouts in seconds (connect, read)
+    'jellyfin_timeout_connect': 3.05,
+    'jellyfin_timeout_read': 10,
+    'emby_timeout_connect': 3.05,
+    'emby_timeout_read': 10,
+    'plex_timeout_connect': 3.05,
+    'plex_timeout_read': 7,
+    'request_default_monitored': False,
+    'request_search_missing': False
+})
+
+
 class ConfigManager:
     """Manager for application configuration"""
     
@@ -16,7 +170,67 @@ class ConfigManager:
             config_file: Path to configuration file
         """
         self.config_file = Path(config_file)
-        self.config = self._load_config()
+        self._mtime = self._get_mtime()
+        self._version = 0
+        self._config = None  # Parsed on first use
+        self._config_view = None  # Read-only view handed out by get_config
+        self._last_digest = None  # Digest of the bytes last read or written
+        
+        # update_setting changes not yet on disk, flushed by a debounce timer
+        self._save_lock = threading.RLock()
+        self._dirty = False
+        self._pending = {}  # key -> value, re-applied if the file is reloaded
+        self._flush_timer = None
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Current configuration, loaded from disk on first access"""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]):
+        self._config = value
+        self._config_view = None
+    
+    def _get_mtime(self):
+        """
+        Get the modification time of the configuration file
+        
+        Returns:
+            Modification time in nanoseconds, or None if the file is missing
+        """
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def _reload_if_changed(self):
+        """Re-parse the configuration file only if it changed on disk"""
+        mtime = self._get_mtime()
+        if mtime is not None and mtime != self._mtime:
+            with self._save_lock:
+                self._mtime = mtime
+                self._config = None  # Re-parsed on next access
+                self._config_view = None
+                self._version += 1
+                if self._pending:
+                    # Keep update_setting changes the debounce hasn't written yet
+                    self._config = {**self._load_config(), **self._pending}
+    
+    def get_version(self) -> int:
+        """
+        Get a counter that changes whenever the configuration changes
+        
+        Lets callers cache values derived from the config and rebuild them
+        only when this number moves.
+        
+        Returns:
+            Configuration version
+        """
+        self._reload_if_changed()
+        return self._version
     
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -27,10 +241,12 @@ class ConfigManager:
         """
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    logger.info("Configuration loaded successfully")
-                    return config
+                data = self.config_file.read_bytes()
+                # Defaults first, so keys added in newer versions are filled in
+                config = {**_DEFAULT_CONFIG, **self._normalize_on_load(orjson.loads(data))}
+                self._last_digest = self._digest(data)
+                logger.info("Configuration loaded successfully")
+                return config
             else:
                 # Return default configuration
                 logger.info("No config file found, using defaults")
@@ -46,52 +262,20 @@ class ConfigManager:
         Returns:
             Default configuration dictionary
         """
-        return {
-            'lidarr_url': '',
-            'lidarr_api_key': '',
-            'output_format': 'mp3',
-            'quality': '320k',
-            'lidarr_path_mapping': {},
-            'microservice_port': 5000,
-            'auto_cleanup': True,
-            'normalize_audio': False,
-            'mono_audio': False,
-            'sample_rate': 'original',
-            'remove_silence': False,
-            'loudness_normalization': False,
-            'channels': 'original',
-            'embed_metadata': True,
-            'embed_thumbnail': True,
-            'source_priorities': [
-                {'name': 'YouTube Music', 'search': 'music.youtube.com', 'enabled': True},
-                {'name': 'SoundCloud', 'search': 'soundcloud.com', 'enabled': True},
-                {'name': 'YouTube', 'search': 'youtube.com', 'enabled': True},
-                {'name': 'Bandcamp', 'search': 'bandcamp.com', 'enabled': True},
-                {'name': 'Spotify', 'search': 'spotify.com', 'enabled': True}
-            ],
-            # Request system defaults
-            'enable_requests': False,
-            'auto_monitor_requests': False,
-            'enable_jellyfin': False,
-            'jellyfin_url': '',
-            'jellyfin_api_key': '',
-            'enable_emby': False,
-            'emby_url': '',
-            'emby_api_key': '',
-            'enable_plex': False,
-            'plex_url': '',
-            'request_default_monitored': False,
-            'request_search_missing': False
-        }
+        return dict(_DEFAULT_CONFIG)
     
-    def get_config(self) -> Dict[str, Any]:
+    def get_config(self) -> Mapping[str, Any]:
         """
         Get current configuration
         
         Returns:
-            Configuration dictionary
+            Read-only view of the configuration (copy it to modify, and
+            persist changes with save_config/update_setting)
         """
-        return self.config.copy()
+        self._reload_if_changed()
+        if self._config_view is None:
+            self._config_view = MappingProxyType(self.config)
+        return self._config_view
     
     def save_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -104,15 +288,32 @@ class ConfigManager:
             True if successful
         """
         try:
-            # Validate configuration
-            validated_config = self._validate_config(config)
-            
-            # Save to file
-            with open(self.config_file, 'w') as f:
-                json.dump(validated_config, f, indent=2)
-            
-            # Update in-memory config
-            self.config = validated_config
+            with self._save_lock:
+                # Validate configuration (merged onto the current config, so
+                # pending update_setting changes are written too)
+                validated_config = self._validate_config(config)
+                
+                # orjson produces the UTF-8 bytes to write directly
+                payload = orjson.dumps(validated_config, option=orjson.OPT_INDENT_2)
+                digest = self._digest(payload)
+                if digest == self._last_digest and self.config_file.exists():
+                    logger.debug("Configuration unchanged, skipping write")
+                    if validated_config is not self._config:
+                        self.config = validated_config
+                        self._version += 1
+                    self._dirty = False
+                    self._pending.clear()
+                    return True
+                
+                self._write_atomic(payload)
+                
+                # Update in-memory config
+                self.config = validated_config
+                self._last_digest = digest
+                self._mtime = self._get_mtime()
+                self._version += 1
+                self._dirty = False
+                self._pending.clear()
             
             logger.info("Configuration saved successfully")
             return True
@@ -121,118 +322,100 @@ class ConfigManager:
             logger.error(f"Error saving configuration: {e}")
             return False
     
-    def _validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _normalize_on_load(config: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Validate and sanitize configuration
+        Apply save-time string normalization to a loaded (possibly
+        hand-edited) file, so readers can use URLs and keys as-is
         
         Args:
-            config: Configuration dictionary
+            config: Configuration read from disk
             
         Returns:
-            Validated configuration dictionary
+            Configuration with URLs and API keys normalized
         """
-        # Start with current config to preserve values not being updated
-        validated = self.config.copy()
-        
-        # Update with provided values
-        if 'lidarr_url' in config:
-            validated['lidarr_url'] = str(config['lidarr_url']).rstrip('/')
-        
-        # Handle API key with special marker to preserve existing
-        if 'lidarr_api_key' in config:
-            api_key = config['lidarr_api_key']
-            if api_key == '***KEEP_EXISTING***':
-                # Keep the existing key (don't change it)
-                pass
-            else:
-                # Update with new value (even if empty string)
-                validated['lidarr_api_key'] = str(api_key)
-        
-        if 'output_format' in config:
-            format_value = str(config['output_format']).lower()
-            if format_value in ['mp3', 'flac', 'wav', 'ogg', 'opus', 'm4a', 'aac']:
-                validated['output_format'] = format_value
-        
-        if 'quality' in config:
-            validated['quality'] = str(config['quality'])
-        
-        if 'lidarr_path_mapping' in config and isinstance(config['lidarr_path_mapping'], dict):
-            validated['lidarr_path_mapping'] = config['lidarr_path_mapping']
-        
-        if 'microservice_port' in config:
-            try:
-                port = int(config['microservice_port'])
-                if 1 <= port <= 65535:
-                    validated['microservice_port'] = port
-            except (ValueError, TypeError):
-                pass
-        
-        if 'auto_cleanup' in config:
-            validated['auto_cleanup'] = bool(config['auto_cleanup'])
-        
-        if 'normalize_audio' in config:
-            validated['normalize_audio'] = bool(config['normalize_audio'])
-        
-        if 'mono_audio' in config:
-            validated['mono_audio'] = bool(config['mono_audio'])
-        
-        if 'sample_rate' in config:
-            validated['sample_rate'] = str(config['sample_rate'])
-        
-        if 'remove_silence' in config:
-            validated['remove_silence'] = bool(config['remove_silence'])
-        
-        if 'loudness_normalization' in config:
-            validated['loudness_normalization'] = bool(config['loudness_normalization'])
-        
-        if 'channels' in config:
-            validated['channels'] = str(config['channels'])
-        
-        if 'embed_metadata' in config:
-            validated['embed_metadata'] = bool(config['embed_metadata'])
-        
-        if 'embed_thumbnail' in config:
-            validated['embed_thumbnail'] = bool(config['embed_thumbnail'])
-        
-        if 'source_priorities' in config and isinstance(config['source_priorities'], list):
-            validated['source_priorities'] = config['source_priorities']
-        
-        # Request system settings
-        if 'enable_requests' in config:
-            validated['enable_requests'] = bool(config['enable_requests'])
-        
-        if 'auto_monitor_requests' in config:
-            validated['auto_monitor_requests'] = bool(config['auto_monitor_requests'])
-        
-        if 'enable_jellyfin' in config:
-            validated['enable_jellyfin'] = bool(config['enable_jellyfin'])
-        
-        if 'jellyfin_url' in config:
-            validated['jellyfin_url'] = str(config['jellyfin_url']).rstrip('/')
-        
-        if 'jellyfin_api_key' in config:
-            validated['jellyfin_api_key'] = str(config['jellyfin_api_key'])
+        for key in (*_URL_KEYS, *_STRIPPED_KEYS, 'lidarr_api_key'):
+            value = config.get(key)
+            if isinstance(value, str):
+                config[key] = _VALIDATORS[key](value)
+        return config
+    
+    @staticmethod
+    def _digest(data: bytes) -> bytes:
+        """
+        Hash serialized configuration for change detection
         
-        if 'enable_emby' in config:
-            validated['enable_emby'] = bool(config['enable_emby'])
+        Args:
+            data: Serialized configuration
+            
+        Returns:
+            16-byte digest
+        """
+        return hashlib.blake2b(data, digest_size=16).digest()
+    
+    def _write_atomic(self, payload: bytes):
+        """
+        Write the configuration file via a temp file and os.replace, so a
+        crash mid-write never leaves a truncated config.json
         
-        if 'emby_url' in config:
-            validated['emby_url'] = str(config['emby_url']).rstrip('/')
+        Docker setups often bind-mount config.json as a single file, which
+        can't be renamed over; those fall back to writing it in place.
         
-        if 'emby_api_key' in config:
-            validated['emby_api_key'] = str(config['emby_api_key'])
+        Args:
+            payload: Serialized configuration
+        """
+        directory = self.config_file.parent
+        fd, temp_name = tempfile.mkstemp(dir=str(directory), prefix='.config-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            if self.config_file.exists():
+                shutil.copymode(self.config_file, temp_name)
+            os.replace(temp_name, self.config_file)
+        except OSError as e:
+            with suppress(FileNotFoundError):
+                os.unlink(temp_name)
+            if e.errno not in (errno.EBUSY, errno.EXDEV):
+                raise
+            logger.debug(f"Cannot replace {self.config_file} ({e.strerror}), writing in place")
+            with open(self.config_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(temp_name)
+            raise
+    
+    def _validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate and sanitize configuration
         
-        if 'enable_plex' in config:
-            validated['enable_plex'] = bool(config['enable_plex'])
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            Validated configuration dictionary
+        """
+        current = self.config
         
-        if 'plex_url' in config:
-            validated['plex_url'] = str(config['plex_url']).rstrip('/')
+        # Nothing differs from the current values (e.g. re-saving an unchanged
+        # form): skip the copy, and save_config's digest check skips the write
+        if all(key in current and current[key] == value for key, value in config.items()):
+            return current
         
-        if 'request_default_monitored' in config:
-            validated['request_default_monitored'] = bool(config['request_default_monitored'])
+        # Start with current config to preserve values not being updated
+        validated = current.copy()
         
-        if 'request_search_missing' in config:
-            validated['request_search_missing'] = bool(config['request_search_missing'])
+        # Update with provided values; a rejected value keeps the current one
+        for key, coerce in _VALIDATORS.items():
+            if key in config:
+                try:
+                    validated[key] = coerce(config[key])
+                except (ValueError, TypeError):
+                    pass
         
         return validated
     
@@ -240,6 +423,10 @@ class ConfigManager:
         """
         Update a single configuration setting
         
+        The change is visible immediately; the file is written after
+        SETTING_FLUSH_DELAY so a burst of updates costs one write. Call
+        flush() to write pending changes right away.
+        
         Args:
             key: Setting key
             value: Setting value
@@ -248,13 +435,41 @@ class ConfigManager:
             True if successful
         """
         try:
-            config = self.config.copy()
-            config[key] = value
-            return self.save_config(config)
+            with self._save_lock:
+                # _validate_config merges onto the current config; a key it
+                # doesn't know (or a value it rejects) changes nothing
+                validated = self._validate_config({key: value})
+                if validated is self.config or key not in _VALIDATORS or validated[key] == self.config.get(key):
+                    return True
+                
+                self.config = validated
+                self._version += 1
+                self._dirty = True
+                self._pending[key] = validated[key]
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(SETTING_FLUSH_DELAY, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            return True
         except Exception as e:
             logger.error(f"Error updating setting: {e}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Write settings changed by update_setting that are not yet on disk
+        
+        Returns:
+            True if successful (or nothing was pending)
+        """
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return True
+            return self.save_config({})
+    
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
         Get a specific configuration setting
@@ -266,4 +481,5 @@ class ConfigManager:
         Returns:
             Setting value
         """
+        self._reload_if_changed()
         return self.config.get(key, default)
@@ -1,13 +1,143 @@
 ﻿import yt_dlp
+import errno
 import os
 import logging
 import shutil
+import tempfile
+import threading
+import weakref
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import quote_plus, urlparse
 from pathlib import Path
 from typing import Dict, Optional
 import subprocess
 
+from .circuit_breaker import CircuitBreaker
+from .resolve_cache import ResolveCache, STATUS_MISS, STATUS_OK
+
 logger = logging.getLogger(__name__)
 
+# Consecutive failures before a source is skipped, and for how long (seconds)
+SOURCE_FAILURE_THRESHOLD = 3
+SOURCE_COOLDOWN = 60
+
+# Source searches run concurrently (shared by all tracks being downloaded);
+# each track keeps at most SOURCE_PROBE_AHEAD of its searches in flight, so
+# the default album_concurrency of 4 fits the pool without queueing
+SOURCE_PROBE_WORKERS = 8
+SOURCE_PROBE_AHEAD = 2
+
+# Parallel connections/fragments per download: aria2c when installed,
+# otherwise yt-dlp's own concurrent fragment downloads (HLS/DASH)
+DOWNLOAD_CONNECTIONS = 8
+
+# yt-dlp FFmpegExtractAudio codec names for Blissful output formats
+YTDLP_CODECS = {
+    'mp3': 'mp3',
+    'flac': 'flac',
+    'wav': 'wav',
+    'ogg': 'vorbis',
+    'opus': 'opus',
+    'm4a': 'm4a',
+    'aac': 'm4a',
+}
+
+# yt-dlp saves AAC in an .m4a container; the converter remuxes it to .aac
+YTDLP_EXTENSIONS = {
+    'aac': 'm4a',
+}
+
+# Source priority entries are matched to a provider by name or search
+# domain, in this order (first match wins)
+SOURCE_PROVIDERS = (
+    ('youtube', 'youtube.com'),
+    ('soundcloud', 'soundcloud.com'),
+    ('bandcamp', 'bandcamp.com'),
+    ('spotify', 'spotify.com'),
+    ('apple', 'apple.com'),
+    ('deezer', 'deezer.com'),
+    ('tidal', 'tidal.com'),
+    ('mixcloud', 'mixcloud.com'),
+    ('archive', 'archive.org'),
+    ('jamendo', 'jamendo.com'),
+    ('freemusicarchive', 'freemusicarchive.org'),
+    ('audiomack', 'audiomack.com'),
+    ('vimeo', 'vimeo.com'),
+    ('dailymotion', 'dailymotion.com'),
+    ('tiktok', 'tiktok.com'),
+    ('reverbnation', 'reverbnation.com'),
+)
+
+# yt-dlp sources per provider; {query} is the search query, {plus_query}
+# the same URL-encoded (spaces as '+') for search page URLs
+SOURCE_TEMPLATES = {
+    'youtube_music': ("ytsearch1:'{query}' site:music.youtube.com",),
+    'youtube': ("ytsearch1:{query}",),
+    'soundcloud': ("scsearch1:{query}",),
+    'bandcamp': ("https://bandcamp.com/search?q={plus_query}",),
+    # Spotify and Deezer extraction, with a YouTube fallback
+    'spotify': ("spsearch:{query}", "ytsearch1:{query} audio"),
+    'deezer': ("dzsearch:{query}", "ytsearch1:{query} deezer"),
+    # No direct extractor - search YouTube instead
+    'apple': ("ytsearch1:{query} apple music",),
+    'tidal': ("ytsearch1:{query} tidal",),
+    'jamendo': ("ytsearch1:{query} jamendo",),
+    'freemusicarchive': ("ytsearch1:{query} free music archive",),
+    'tiktok': ("ytsearch1:{query} tiktok",),
+    'reverbnation': ("ytsearch1:{query} reverbnation",),
+    'mixcloud': ("https://www.mixcloud.com/search/?q={plus_query}",),
+    'archive': ("https://archive.org/search.php?query={plus_query}&and[]=mediatype:audio",),
+    'audiomack': ("https://audiomack.com/search?q={plus_query}",),
+    'vimeo': ("https://vimeo.com/search?q={plus_query}",),
+    'dailymotion': ("https://www.dailymotion.com/search/{plus_query}",),
+}
+
+
+@lru_cache(maxsize=256)
+def _classify_source(name: str, search: str) -> Optional[str]:
+    """
+    Match a source priority entry to a SOURCE_TEMPLATES provider
+    
+    Priorities come from config and repeat for every track, so each
+    name/search pair is only scanned once.
+    
+    Args:
+        name: Lowercased priority name (e.g. "youtube music")
+        search: Lowercased priority search domain (e.g. "music.youtube.com")
+        
+    Returns:
+        Provider key, or None if the entry matches no known provider
+    """
+    for provider, domain in SOURCE_PROVIDERS:
+        if provider in name or domain in search:
+            if provider == 'youtube' and ('music' in name or 'music.youtube' in search):
+                return 'youtube_music'
+            return provider
+    return None
+
+@lru_cache(maxsize=8)
+def _normalized_path_mapping(items: tuple) -> tuple:
+    """
+    Normalize a path mapping once per distinct mapping
+    
+    Args:
+        items: Path mapping items (microservice_path, lidarr_path)
+        
+    Returns:
+        Tuple of (microservice_path, lidarr_path) with forward slashes,
+        longest Lidarr path first so nested mappings win over their parents
+    """
+    normalized = (
+        (micro_path.replace('\\', '/'), lidarr_path.replace('\\', '/'))
+        for micro_path, lidarr_path in items
+    )
+    return tuple(sorted(normalized, key=lambda pair: len(pair[1]), reverse=True))
+
+# Characters not allowed in file names (Windows is the strictest), replaced with '_'
+FILENAME_TRANSLATION = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
 class DownloadManager:
     """Manager for downloading tracks using yt-dlp"""
     
@@ -24,6 +154,37 @@ class DownloadManager:
         # Temporary directory for downloads
         self.temp_dir = self.download_dir / 'temp'
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Split downloads into parallel range requests when aria2c is installed
+        if shutil.which('aria2c'):
+            logger.info("aria2c found, using it for downloads")
+            self._download_opts = {
+                'external_downloader': {'http': 'aria2c'},
+                'external_downloader_args': {'aria2c': [
+                    '-x', str(DOWNLOAD_CONNECTIONS), '-s', str(DOWNLOAD_CONNECTIONS), '-k', '1M'
+                ]},
+            }
+        else:
+            self._download_opts = {'concurrent_fragment_downloads': DOWNLOAD_CONNECTIONS}
+        
+        # Where tracks were found before (or that no source had them)
+        self._resolve_cache = ResolveCache(self.download_dir / 'resolve_cache.db')
+        
+        # Per-source circuit breakers
+        self._source_breakers = {}
+        self._source_lock = threading.Lock()
+        
+        # Runs the per-source searches (extract_info without download)
+        self._probe_pool = ThreadPoolExecutor(max_workers=SOURCE_PROBE_WORKERS, thread_name_prefix='probe')
+        
+        # YoutubeDL instances are reused (extractors, postprocessors and the
+        # HTTP handler are set up once) but aren't thread-safe, so each thread
+        # keeps its own, keyed by output codec and Spotify login. The set is
+        # weak so instances of short-lived worker threads (e.g. AlbumManager's
+        # per-album pool) are freed with their thread.
+        self._ydl_local = threading.local()
+        self._ydl_instances = weakref.WeakSet()
+        self._ydl_lock = threading.Lock()
     
     def check_ytdlp(self) -> bool:
         """
@@ -32,11 +193,9 @@ class DownloadManager:
         Returns:
             True if yt-dlp is available
         """
-        try:
-            import yt_dlp
-            return True
-        except ImportError:
-            return False
+        # yt_dlp is imported at module level, so this module wouldn't have
+        # loaded without it
+        return True
     
     def download_track(
         self,
@@ -44,7 +203,8 @@ class DownloadManager:
         title: str,
         album: str = '',
         output_format: str = 'mp3',
-        source_priorities: list = None
+        source_priorities: list = None,
+        quality: str = '320k'
     ) -> Dict:
         """
         Download a track based on metadata
@@ -55,6 +215,7 @@ class DownloadManager:
             album: Album name (optional)
             output_format: Desired output format
             source_priorities: Optional list of source priorities
+            quality: Audio bitrate for lossy formats (e.g. 320k)
             
         Returns:
             Dict with success status and file path or error
@@ -77,24 +238,112 @@ class DownloadManager:
                     f"scsearch1:{search_query}",  # SoundCloud search
                 ]
             
+            # A previous run already found the track (download it straight
+            # from that URL) or found no source had it
+            cache_key = ResolveCache.key(artist, title, album)
+            signature = ResolveCache.sources_signature(sources)
+            cached = self._resolve_cache.get(cache_key)
+            if cached == (STATUS_MISS, signature):
+                logger.info(f"Skipping search for {search_query}: no source had it recently")
+                return {
+                    'success': False,
+                    'error': 'No results found'
+                }
+            # Each download gets its own temp directory, so tracks with the same
+            # name (e.g. two "Interlude"s on one album) can download at once
+            job_dir = Path(tempfile.mkdtemp(dir=str(self.temp_dir), prefix='job-'))
+            
+            if cached and cached[0] == STATUS_OK:
+                logger.info(f"Using previously found source: {cached[1]}")
+                ydl_opts, safe_filename, extension = self._ydl_options(
+                    cached[1], artist, title, output_format, quality, job_dir
+                )
+                result = self._fetch_from_source(cached[1], ydl_opts, safe_filename, extension, job_dir)
+                if result['success']:
+                    return {
+                        'success': True,
+                        'file_path': result['file_path'],
+                        'artist': artist,
+                        'title': title
+                    }
+                # The URL stopped working - forget it and search again
+                self._resolve_cache.delete(cache_key)
+            
             downloaded_file = None
             last_error = None
+            misses = 0
             
+            # Search the top sources concurrently and take the results in
+            # priority order: the first source that has the track wins, and a
+            # miss on the top source costs the slowest search, not their sum.
+            # Lower sources are only searched as higher ones come up empty.
+            candidates = []
             for source in sources:
-                try:
-                    logger.info(f"Trying source: {source}")
-                    result = self._download_from_source(source, artist, title)
-                    
-                    if result['success']:
-                        downloaded_file = result['file_path']
-                        break
-                    else:
-                        last_error = result.get('error')
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to download from source {source}: {e}")
-                    last_error = str(e)
+                source_key = self._source_key(source)
+                breaker = self._source_breaker(source_key)
+                if not breaker.allow():
+                    logger.info(f"Skipping source {source_key}: too many recent failures")
+                    last_error = last_error or f'Source {source_key} temporarily unavailable'
                     continue
+                
+                ydl_opts, safe_filename, extension = self._ydl_options(
+                    source, artist, title, output_format, quality, job_dir
+                )
+                candidates.append((source, source_key, breaker, ydl_opts, safe_filename, extension))
+            
+            probes = [None] * len(candidates)
+            
+            def submit_probes(start):
+                # Keep the next SOURCE_PROBE_AHEAD searches (from start) in flight
+                for i in range(start, min(start + SOURCE_PROBE_AHEAD, len(candidates))):
+                    if probes[i] is None or probes[i].cancelled():
+                        probes[i] = self._probe_pool.submit(self._probe_source, candidates[i][0], candidates[i][3])
+            
+            try:
+                for index, (source, source_key, breaker, ydl_opts, safe_filename, extension) in enumerate(candidates):
+                    submit_probes(index)
+                    try:
+                        logger.info(f"Trying source: {source}")
+                        probe = probes[index].result()
+                        result = probe
+                        if probe['success']:
+                            # Free the pool for other tracks' searches before
+                            # spending time on the download
+                            for pending in probes[index + 1:]:
+                                if pending is not None:
+                                    pending.cancel()
+                            result = self._fetch_from_source(source, ydl_opts, safe_filename, extension,
+                                                             job_dir, info=probe.get('info'))
+                        
+                        if result['success']:
+                            breaker.record_success()
+                            downloaded_file = result['file_path']
+                            if probe.get('url'):
+                                self._resolve_cache.put(cache_key, STATUS_OK, probe['url'])
+                            break
+                        else:
+                            last_error = result.get('error')
+                            # "No results" is a miss for this track, not a broken source
+                            if last_error != 'No results found':
+                                self._record_source_failure(source_key, breaker)
+                            else:
+                                misses += 1
+                            
+                    except Exception as e:
+                        logger.warning(f"Failed to download from source {source}: {e}")
+                        self._record_source_failure(source_key, breaker)
+                        last_error = str(e)
+                        continue
+            finally:
+                # Searches that haven't started yet are no longer needed
+                for pending in probes:
+                    if pending is not None:
+                        pending.cancel()
+            
+            # Only a clean miss on every configured source is remembered;
+            # errors and skipped (circuit-open) sources are retried next time
+            if not downloaded_file and misses == len(sources):
+                self._resolve_cache.put(cache_key, STATUS_MISS, signature)
             
             if downloaded_file:
                 return {
@@ -104,6 +353,7 @@ class DownloadManager:
                     'title': title
                 }
             else:
+                shutil.rmtree(job_dir, ignore_errors=True)
                 return {
                     'success': False,
                     'error': last_error or 'Could not find track from any source'
@@ -116,6 +366,64 @@ class DownloadManager:
                 'error': str(e)
             }
     
+    def _source_key(self, source: str) -> str:
+        """
+        Get the circuit breaker key for a yt-dlp source string
+        
+        Args:
+            source: yt-dlp source string (search prefix or URL)
+            
+        Returns:
+            Search prefix (e.g. ytsearch1) or URL host
+        """
+        if source.startswith(('http://', 'https://')):
+            return urlparse(source).netloc
+        return source.split(':', 1)[0]
+    
+    def _source_breaker(self, source_key: str) -> CircuitBreaker:
+        """
+        Get (or create) the circuit breaker for a source
+        
+        Args:
+            source_key: Source key from _source_key
+            
+        Returns:
+            CircuitBreaker for the source
+        """
+        with self._source_lock:
+            breaker = self._source_breakers.get(source_key)
+            if breaker is None:
+                breaker = CircuitBreaker(fail_max=SOURCE_FAILURE_THRESHOLD, reset_timeout=SOURCE_COOLDOWN)
+                self._source_breakers[source_key] = breaker
+            return breaker
+    
+    def _record_source_failure(self, source_key: str, breaker: CircuitBreaker):
+        """
+        Record a failed download attempt for a source
+        
+        Args:
+            source_key: Source key from _source_key
+            breaker: The source's circuit breaker
+        """
+        if breaker.record_failure():
+            logger.warning(f"Source {source_key} failed {breaker.failures} times in a row, "
+                           f"skipping it for {SOURCE_COOLDOWN}s")
+    
+    def get_source_health(self) -> Dict:
+        """
+        Get circuit breaker state for all sources that have failed recently
+        
+        Returns:
+            Dict of source key -> failure count and seconds until retry
+        """
+        with self._source_lock:
+            breakers = list(self._source_breakers.items())
+        return {
+            key: breaker.status()
+            for key, breaker in breakers
+            if breaker.failures
+        }
+    
     def _build_source_list(self, search_query: str, priorities: list) -> list:
         """
         Build ordered source list based on priorities
@@ -128,84 +436,20 @@ class DownloadManager:
             List of yt-dlp source strings
         """
         sources = []
+        # URL-encoded once: '&', '#' or '?' in a title would otherwise break
+        # the search page URLs
+        plus_query = quote_plus(search_query)
         
         for priority in priorities:
             if not priority.get('enabled', True):
                 continue
             
-            name = priority.get('name', '').lower()
-            search = priority.get('search', '').lower()
-            
-            # YouTube and YouTube Music
-            if 'youtube' in name or 'youtube.com' in search:
-                if 'music' in name or 'music.youtube' in search:
-                    sources.append(f"ytsearch1:'{search_query}' site:music.youtube.com")
-                else:
-                    sources.append(f"ytsearch1:{search_query}")
-            
-            # SoundCloud
-            elif 'soundcloud' in name or 'soundcloud.com' in search:
-                sources.append(f"scsearch1:{search_query}")
-            
-            # Bandcamp
-            elif 'bandcamp' in name or 'bandcamp.com' in search:
-                sources.append(f"https://bandcamp.com/search?q={search_query.replace(' ', '+')}")
-            
-            # Spotify
-            elif 'spotify' in name or 'spotify.com' in search:
-                sources.append(f"spsearch:{search_query}")
-                # Add YouTube fallback for Spotify
-                sources.append(f"ytsearch1:{search_query} audio")
-            
-            # Apple Music
-            elif 'apple' in name or 'apple.com' in search:
-                # Apple Music extraction, then fallback to YouTube
-                sources.append(f"ytsearch1:{search_query} apple music")
-            
-            # Deezer
-            elif 'deezer' in name or 'deezer.com' in search:
-                sources.append(f"dzsearch:{search_query}")
-                sources.append(f"ytsearch1:{search_query} deezer")
-            
-            # Tidal
-            elif 'tidal' in name or 'tidal.com' in search:
-                sources.append(f"ytsearch1:{search_query} tidal")
-            
-            # Mixcloud
-            elif 'mixcloud' in name or 'mixcloud.com' in search:
-                sources.append(f"https://www.mixcloud.com/search/?q={search_query.replace(' ', '+')}")
-            
-            # Archive.org
-            elif 'archive' in name or 'archive.org' in search:
-                sources.append(f"https://archive.org/search.php?query={search_query.replace(' ', '+')}&and[]=mediatype:audio")
-            
-            # Jamendo
-            elif 'jamendo' in name or 'jamendo.com' in search:
-                sources.append(f"ytsearch1:{search_query} jamendo")
-            
-            # Free Music Archive
-            elif 'freemusicarchive' in name or 'freemusicarchive.org' in search:
-                sources.append(f"ytsearch1:{search_query} free music archive")
-            
-            # Audiomack
-            elif 'audiomack' in name or 'audiomack.com' in search:
-                sources.append(f"https://audiomack.com/search?q={search_query.replace(' ', '+')}")
-            
-            # Vimeo
-            elif 'vimeo' in name or 'vimeo.com' in search:
-                sources.append(f"https://vimeo.com/search?q={search_query.replace(' ', '+')}")
-            
-            # Dailymotion
-            elif 'dailymotion' in name or 'dailymotion.com' in search:
-                sources.append(f"https://www.dailymotion.com/search/{search_query.replace(' ', '+')}")
-            
-            # TikTok
-            elif 'tiktok' in name or 'tiktok.com' in search:
-                sources.append(f"ytsearch1:{search_query} tiktok")
-            
-            # Reverbnation
-            elif 'reverbnation' in name or 'reverbnation.com' in search:
-                sources.append(f"ytsearch1:{search_query} reverbnation")
+            provider = _classify_source(priority.get('name', '').lower(), priority.get('search', '').lower())
+            if provider:
+                sources.extend(
+                    template.format(query=search_query, plus_query=plus_query)
+                    for template in SOURCE_TEMPLATES[provider]
+                )
         
         # If no sources were added, add default fallbacks
         if not sources:
@@ -214,102 +458,239 @@ class DownloadManager:
                 f"scsearch1:{search_query}",
             ]
         
-        return sources
+        # Overlapping providers (or a provider listed twice) can produce the
+        # same source; search each only once, keeping the first position
+        return list(dict.fromkeys(sources))
     
-    def _download_from_source(self, source: str, artist: str, title: str) -> Dict:
+    def _ydl_options(
+        self,
+        source: str,
+        artist: str,
+        title: str,
+        output_format: str = 'mp3',
+        quality: str = '320k',
+        job_dir: Optional[Path] = None
+    ) -> tuple:
         """
-        Download from a specific source
+        Build the yt-dlp options for downloading a track from a source
         
         Args:
             source: yt-dlp source string
             artist: Artist name
             title: Track title
+            output_format: Desired output format, extracted directly by yt-dlp
+            quality: Audio bitrate for lossy formats (e.g. 320k)
+            job_dir: Directory to download into (defaults to temp_dir)
             
         Returns:
-            Dict with success status and file path
+            Tuple of (yt-dlp options, sanitized file name, file extension)
         """
+        # Sanitize filename
+        safe_filename = self._sanitize_filename(f"{artist} - {title}")
+        output_template = str((job_dir or self.temp_dir) / f"{safe_filename}.%(ext)s")
+        
+        # Extract straight to the target format so the converter doesn't
+        # have to decode and re-encode the file a second time
+        output_format = output_format.lower()
+        if output_format not in YTDLP_CODECS:
+            output_format = 'mp3'
+        
+        # yt-dlp wants the bitrate as a bare kbps number ('320', not '320k')
+        bitrate = str(quality).strip().lower().rstrip('k')
         try:
-            # Sanitize filename
-            safe_filename = self._sanitize_filename(f"{artist} - {title}")
-            output_template = str(self.temp_dir / f"{safe_filename}.%(ext)s")
-            
-            ydl_opts = {
-                'format': 'bestaudio/best',
-                'outtmpl': output_template,
-                'quiet': False,
-                'no_warnings': False,
+            float(bitrate)
+        except ValueError:
+            bitrate = '320'
+        
+        ydl_opts = {
+            'format': 'bestaudio/best',
+            'outtmpl': output_template,
+            'quiet': False,
+            'no_warnings': False,
+            'extract_flat': False,
+            'postprocessors': [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': YTDLP_CODECS[output_format],
+                'preferredquality': bitrate,
+            }],
+            'prefer_ffmpeg': True,
+            'keepvideo': False,
+            'noplaylist': True,
+            **self._download_opts,
+            # Removed max_downloads - it was causing "MaxDownloadsReached" error
+            # because yt-dlp counts search + download as 2 downloads
+        }
+        
+        # Special handling for Spotify
+        if source.startswith('spsearch:') or 'spotify.com' in source:
+            # Spotify support requires additional configuration
+            ydl_opts.update({
+                'username': 'oauth',  # Use OAuth if configured
                 'extract_flat': False,
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '320',
-                }],
-                'prefer_ffmpeg': True,
-                'keepvideo': False,
-                'noplaylist': True,
-                # Removed max_downloads - it was causing "MaxDownloadsReached" error
-                # because yt-dlp counts search + download as 2 downloads
-            }
+            })
+            logger.info("Using Spotify extractor")
+        
+        return ydl_opts, safe_filename, YTDLP_EXTENSIONS.get(output_format, output_format)
+    
+    def _get_ydl(self, ydl_opts: Dict) -> yt_dlp.YoutubeDL:
+        """
+        Get this thread's YoutubeDL for a set of options
+        
+        Args:
+            ydl_opts: Options from _ydl_options
             
-            # Special handling for Spotify
-            if source.startswith('spsearch:') or 'spotify.com' in source:
-                # Spotify support requires additional configuration
-                ydl_opts.update({
-                    'username': 'oauth',  # Use OAuth if configured
-                    'extract_flat': False,
-                })
-                logger.info("Using Spotify extractor")
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # Extract info first to verify
-                try:
-                    info = ydl.extract_info(source, download=False)
-                except Exception as e:
-                    # If Spotify fails, return error to try next source
-                    if 'spsearch:' in source or 'spotify' in source:
-                        logger.warning(f"Spotify extraction failed: {e}")
-                        return {
-                            'success': False,
-                            'error': f'Spotify unavailable: {str(e)}'
-                        }
-                    raise
-                
-                if not info or ('entries' in info and not info['entries']):
+        Returns:
+            YoutubeDL with the options' output template applied
+        """
+        extract = ydl_opts['postprocessors'][0]
+        key = (extract['preferredcodec'], extract['preferredquality'], ydl_opts.get('username'))
+        cache = getattr(self._ydl_local, 'instances', None)
+        if cache is None:
+            cache = self._ydl_local.instances = {}
+        
+        ydl = cache.get(key)
+        if ydl is None:
+            ydl = cache[key] = yt_dlp.YoutubeDL(ydl_opts)
+            with self._ydl_lock:
+                self._ydl_instances.add(ydl)
+        else:
+            # The only option that changes from track to track
+            ydl.params['outtmpl'] = {**ydl.params['outtmpl'], 'default': ydl_opts['outtmpl']}
+        return ydl
+    
+    def close(self):
+        """Close the cached YoutubeDL instances (saves cookies, closes connections)"""
+        with self._ydl_lock:
+            instances = list(self._ydl_instances)
+            self._ydl_instances.clear()
+        for ydl in instances:
+            try:
+                ydl.close()
+            except Exception as e:
+                logger.debug(f"Error closing yt-dlp instance: {e}")
+    
+    def _probe_source(self, source: str, ydl_opts: Dict) -> Dict:
+        """
+        Check whether a source has a result, without downloading it
+        
+        Args:
+            source: yt-dlp source string
+            ydl_opts: Options from _ydl_options
+            
+        Returns:
+            Dict with success status, or error
+        """
+        try:
+            ydl = self._get_ydl(ydl_opts)
+            try:
+                info = ydl.extract_info(source, download=False)
+            except Exception as e:
+                # If Spotify fails, return error to try next source
+                if 'spsearch:' in source or 'spotify' in source:
+                    logger.warning(f"Spotify extraction failed: {e}")
                     return {
                         'success': False,
-                        'error': 'No results found'
+                        'error': f'Spotify unavailable: {str(e)}'
                     }
-                
-                # Download the first result
+                raise
+            
+            if not info or ('entries' in info and not info['entries']):
+                return {
+                    'success': False,
+                    'error': 'No results found'
+                }
+            
+            # The first result is downloaded from this info without searching
+            # again; its URL is remembered so a repeat download can skip the search
+            entry = info['entries'][0] if 'entries' in info else info
+            return {
+                'success': True,
+                'info': entry,
+                'url': entry.get('webpage_url') or entry.get('url')
+            }
+            
+        except yt_dlp.utils.DownloadError as e:
+            logger.warning(f"Download error: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+        except Exception as e:
+            logger.error(f"Unexpected error searching: {e}", exc_info=True)
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    def _fetch_from_source(
+        self,
+        source: str,
+        ydl_opts: Dict,
+        safe_filename: str,
+        extension: str,
+        job_dir: Path,
+        info: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Download the first result from a source that _probe_source found
+        
+        Args:
+            source: yt-dlp source string
+            ydl_opts: Options from _ydl_options
+            safe_filename: Sanitized file name from _ydl_options
+            extension: Target file extension from _ydl_options
+            job_dir: Directory the options download into
+            info: Result info from _probe_source, to download without
+                repeating the search (optional)
+            
+        Returns:
+            Dict with success status and file path
+        """
+        try:
+            ydl = self._get_ydl(ydl_opts)
+            # Download the first result
+            if info is not None:
+                try:
+                    info = ydl.process_ie_result(info, download=True)
+                except yt_dlp.utils.DownloadError as e:
+                    # e.g. the stream URLs from the search expired - resolve again
+                    logger.warning(f"Download from search result failed ({e}), retrying {source}")
+                    info = ydl.extract_info(source, download=True)
+            else:
                 info = ydl.extract_info(source, download=True)
+            
+            # Find the downloaded file
+            if info and 'entries' in info:
+                info = info['entries'][0]
+            
+            # The file should be in job_dir with the target extension
+            expected_file = job_dir / f"{safe_filename}.{extension}"
+            
+            if expected_file.exists():
+                logger.info(f"Successfully downloaded: {expected_file}")
+                return {
+                    'success': True,
+                    'file_path': str(expected_file)
+                }
+            else:
+                # Try to find the file with any extension (a plain prefix
+                # match - glob would treat [ ] in titles as patterns)
+                prefix = f"{safe_filename}."
+                with os.scandir(job_dir) as entries:
+                    for entry in entries:
+                        if (entry.name.startswith(prefix) and not entry.name.endswith('.part')
+                                and entry.is_file()):
+                            logger.info(f"Found downloaded file: {entry.path}")
+                            return {
+                                'success': True,
+                                'file_path': entry.path
+                            }
                 
-                # Find the downloaded file
-                if info and 'entries' in info:
-                    info = info['entries'][0]
-                
-                # The file should be in temp_dir with .mp3 extension
-                expected_file = self.temp_dir / f"{safe_filename}.mp3"
+                return {
+                    'success': False,
+                    'error': 'Downloaded file not found'
+                }
                 
-                if expected_file.exists():
-                    logger.info(f"Successfully downloaded: {expected_file}")
-                    return {
-                        'success': True,
-                        'file_path': str(expected_file)
-                    }
-                else:
-                    # Try to find the file with any extension
-                    for file in self.temp_dir.glob(f"{safe_filename}.*"):
-                        logger.info(f"Found downloaded file: {file}")
-                        return {
-                            'success': True,
-                            'file_path': str(file)
-                        }
-                    
-                    return {
-                        'success': False,
-                        'error': 'Downloaded file not found'
-                    }
-                    
         except yt_dlp.utils.DownloadError as e:
             logger.warning(f"Download error: {e}")
             return {
@@ -333,19 +714,9 @@ class DownloadManager:
         Returns:
             Sanitized filename
         """
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        
-        # Remove leading/trailing spaces and dots
-        filename = filename.strip('. ')
-        
-        # Limit length
-        if len(filename) > 200:
-            filename = filename[:200]
-        
-        return filename
+        # Replace invalid characters, remove leading/trailing spaces and
+        # dots, and limit length
+        return filename.translate(FILENAME_TRANSLATION).strip('. ')[:200]
     
     def move_to_target(
         self,
@@ -372,16 +743,11 @@ class DownloadManager:
             
             # Apply path mapping if provided
             if path_mapping:
-                for micro_path, lidarr_path in path_mapping.items():
-                    # Normalize both paths for comparison
-                    micro_path_norm = micro_path.replace('\\', '/')
-                    lidarr_path_norm = lidarr_path.replace('\\', '/')
-                    target_path_norm = target_path.replace('\\', '/')
-                    
-                    if target_path_norm.startswith(lidarr_path_norm):
+                for micro_path, lidarr_path in _normalized_path_mapping(tuple(path_mapping.items())):
+                    if target_path.startswith(lidarr_path):
                         # Replace Lidarr path with microservice path
-                        target_path = target_path_norm.replace(lidarr_path_norm, micro_path_norm, 1)
-                        logger.info(f"Path mapping applied: {lidarr_path_norm} -> {micro_path_norm}")
+                        target_path = micro_path + target_path[len(lidarr_path):]
+                        logger.info(f"Path mapping applied: {lidarr_path} -> {micro_path}")
                         break
             
             # Convert to Path object (handles platform-specific separators)
@@ -393,7 +759,12 @@ class DownloadManager:
             logger.info(f"Moving file from {source} to {target}")
             
             # Move file
-            shutil.move(str(source), str(target))
+            target = self._move_file(source, target)
+            
+            # Drop the download's now-empty job directory
+            if source.parent.parent == self.temp_dir:
+                with suppress(OSError):
+                    source.parent.rmdir()
             
             logger.info(f"✅ Successfully moved file to: {target}")
             return str(target)
@@ -403,12 +774,86 @@ class DownloadManager:
             # Return source path if move failed
             return source_file
     
+    def _move_file(self, source: Path, target: Path):
+        """
+        Move a file, renaming when possible and copying in the kernel otherwise
+        
+        Cross-device copies go to a temporary name next to the target first,
+        so Lidarr never sees a half-written file.
+        
+        Args:
+            source: File to move
+            target: Destination path, or an existing directory to move into
+        
+        Returns:
+            Path the file ended up at
+        """
+        # Like shutil.move, a directory target means "put it inside"
+        if target.is_dir():
+            target = target / source.name
+        
+        try:
+            os.replace(source, target)
+            return target
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        
+        partial = target.with_name(f".{target.name}.partial")
+        try:
+            self._copy_file(source, partial)
+            # Keep mode and mtime like shutil.move's copy2 did, so library
+            # scanners don't see the file as changed
+            shutil.copystat(source, partial)
+            os.replace(partial, target)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        source.unlink()
+        return target
+    
+    def _copy_file(self, source: Path, target: Path):
+        """
+        Copy file contents without bouncing them through Python
+        
+        Uses copy_file_range (instant reflinks on Btrfs/XFS) and falls back
+        to shutil.copyfile, which uses sendfile on Linux.
+        
+        Args:
+            source: File to copy
+            target: Destination path (overwritten)
+        """
+        if hasattr(os, 'copy_file_range'):
+            try:
+                with open(source, 'rb') as src, open(target, 'wb') as dst:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                if remaining == 0:
+                    return
+            except OSError as e:
+                # Not supported across these filesystems / by this kernel
+                logger.debug(f"copy_file_range unavailable ({e}), falling back to copyfile")
+        shutil.copyfile(source, target)
+    
     def cleanup_temp(self):
         """Clean up temporary download directory"""
         try:
-            for file in self.temp_dir.glob('*'):
-                if file.is_file():
-                    file.unlink()
+            # DirEntry.is_file uses the type from the directory listing, so
+            # this is one getdents pass rather than a stat per file
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            pass  # Removed by a concurrent download/cleanup
+                    elif entry.is_dir(follow_symlinks=False):
+                        # Per-download job directories
+                        shutil.rmtree(entry.path, ignore_errors=True)
             logger.info("Cleaned up temporary downloads")
         except Exception as e:
             logger.error(f"Error cleaning up temp directory: {e}")
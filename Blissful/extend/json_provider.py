@@ -0,0 +1,42 @@
+"""
+JSON Provider for Blissful
+Serializes Flask requests and responses with orjson
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize data as JSON
+        
+        Args:
+            obj: Data to serialize
+            **kwargs: indent/sort_keys as passed by Flask; other options are ignored
+            
+        Returns:
+            str: JSON text
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        """
+        Deserialize data as JSON
+        
+        Args:
+            s: JSON text or bytes
+            
+        Returns:
+            Deserialized data
+        """
+        return orjson.loads(s)
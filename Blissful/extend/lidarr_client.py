@@ -1,9 +1,40 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import logging
-from typing import Dict, List, Optional
+import orjson
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# One connection pool shared by every LidarrClient, so clients created per
+# request still reuse keep-alive connections. Idempotent requests (GET) are
+# retried on gateway errors; the final response is returned, not raised.
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False)
+)
+
+# Lidarr settings that rarely change (quality/metadata profiles, root
+# folders), cached per server + API key for add_artist
+SETTINGS_CACHE_TTL = 300
+_settings_cache = {}
+_settings_cache_lock = threading.Lock()
+
+# Runs independent lookups (e.g. add_artist's existence check and settings)
+# concurrently on the shared connection pool
+_lookup_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='lidarr')
+
+
+def _json(response: requests.Response):
+    """Decode a response body with orjson (much faster on large artist/album lists)"""
+    return orjson.loads(response.content)
+
+
 class LidarrClient:
     """Client for interacting with Lidarr API"""
     
@@ -21,6 +52,13 @@ class LidarrClient:
             'X-Api-Key': api_key,
             'Content-Type': 'application/json'
         }
+        
+        # The session only carries this client's headers; connections come
+        # from the shared module-level pool
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('http://', _ADAPTER)
+        self.session.mount('https://', _ADAPTER)
     
     def test_connection(self) -> Dict:
         """
@@ -30,14 +68,13 @@ class LidarrClient:
             Dict with success status and message
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/system/status",
-                headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 return {
                     'success': True,
                     'message': f"Connected to Lidarr v{data.get('version', 'unknown')}",
@@ -76,14 +113,13 @@ class LidarrClient:
             Artist data or None
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/artist/{artist_id}",
-                headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                return _json(response)
             else:
                 logger.error(f"Failed to get artist {artist_id}: {response.status_code}")
                 return None
@@ -102,14 +138,13 @@ class LidarrClient:
             Album data or None
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/album/{album_id}",
-                headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                return _json(response)
             else:
                 logger.error(f"Failed to get album {album_id}: {response.status_code}")
                 return None
@@ -128,15 +163,14 @@ class LidarrClient:
             Album data or None
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/album",
-                headers=self.headers,
                 params={'foreignAlbumId': foreign_album_id},
                 timeout=10
             )
             
             if response.status_code == 200:
-                albums = response.json()
+                albums = _json(response)
                 if albums and len(albums) > 0:
                     return albums[0]  # Return first match
                 else:
@@ -160,15 +194,14 @@ class LidarrClient:
             List of track data
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/track",
-                headers=self.headers,
                 params={'albumId': album_id},
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                return _json(response)
             else:
                 logger.error(f"Failed to get tracks for album {album_id}: {response.status_code}")
                 return []
@@ -191,15 +224,14 @@ class LidarrClient:
             if artist_id:
                 params['artistId'] = artist_id
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/wanted/missing",
-                headers=self.headers,
                 params=params,
                 timeout=10
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 return data.get('records', [])
             else:
                 logger.error(f"Failed to get missing tracks: {response.status_code}")
@@ -219,10 +251,12 @@ class LidarrClient:
             List of missing album data
         """
         try:
-            # Get all albums
-            response = requests.get(
+            # Get all albums - or only the artist's, so Lidarr doesn't send
+            # (and we don't buffer and decode) the whole library
+            params = {'artistId': artist_id} if artist_id is not None else None
+            response = self.session.get(
                 f"{self.url}/api/v1/album",
-                headers=self.headers,
+                params=params,
                 timeout=10
             )
             
@@ -230,7 +264,7 @@ class LidarrClient:
                 logger.error(f"Failed to get albums: {response.status_code}")
                 return []
             
-            albums = response.json()
+            albums = _json(response)
             
             # Filter for missing albums
             missing_albums = []
@@ -259,14 +293,13 @@ class LidarrClient:
             List of matching artists
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/artist",
-                headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                artists = response.json()
+                artists = _json(response)
                 # Filter by name (case-insensitive)
                 search_lower = artist_name.lower()
                 return [
@@ -291,9 +324,8 @@ class LidarrClient:
             True if successful
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url}/api/v1/command",
-                headers=self.headers,
                 json={
                     'name': 'RefreshArtist',
                     'artistId': artist_id
@@ -317,9 +349,8 @@ class LidarrClient:
             True if successful
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url}/api/v1/command",
-                headers=self.headers,
                 json={
                     'name': 'RescanFolders',
                     'folders': []
@@ -355,9 +386,8 @@ class LidarrClient:
                 return False
             
             # Trigger artist rescan which will pick up new files
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url}/api/v1/command",
-                headers=self.headers,
                 json={
                     'name': 'RefreshArtist',
                     'artistId': artist_id
@@ -382,15 +412,14 @@ class LidarrClient:
             List of track file data
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/trackfile",
-                headers=self.headers,
                 params={'albumId': album_id},
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                return _json(response)
             else:
                 logger.error(f"Failed to get track files for album {album_id}: {response.status_code}")
                 return []
@@ -406,14 +435,13 @@ class LidarrClient:
             List of root folder paths
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/rootfolder",
-                headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                folders = response.json()
+                folders = _json(response)
                 result = []
                 
                 for folder in folders:
@@ -447,15 +475,14 @@ class LidarrClient:
             List of artist search results from MusicBrainz via Lidarr
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/artist/lookup",
-                headers=self.headers,
                 params={'term': term},
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                return _json(response)
             else:
                 logger.error(f"Failed to search artists: {response.status_code}")
                 return []
@@ -471,14 +498,13 @@ class LidarrClient:
             List of quality profiles
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/qualityprofile",
-                headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                return _json(response)
             else:
                 logger.error(f"Failed to get quality profiles: {response.status_code}")
                 return []
@@ -494,14 +520,13 @@ class LidarrClient:
             List of metadata profiles
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.url}/api/v1/metadataprofile",
-                headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                return response.json()
+                return _json(response)
             else:
                 logger.error(f"Failed to get metadata profiles: {response.status_code}")
                 return []
@@ -509,6 +534,30 @@ class LidarrClient:
             logger.error(f"Error getting metadata profiles: {e}")
             return []
     
+    def _cached_settings(self, name: str, loader: Callable[[], List[Dict]]) -> List[Dict]:
+        """
+        Get a rarely-changing Lidarr setting, reloading it after SETTINGS_CACHE_TTL
+        
+        Args:
+            name: Setting name (cache key)
+            loader: Method that fetches it from Lidarr
+            
+        Returns:
+            Cached or freshly loaded value (failures are not cached)
+        """
+        key = (self.url, self.api_key, name)
+        now = time.monotonic()
+        with _settings_cache_lock:
+            cached = _settings_cache.get(key)
+        if cached and now - cached[0] < SETTINGS_CACHE_TTL:
+            return cached[1]
+        
+        value = loader()
+        if value:
+            with _settings_cache_lock:
+                _settings_cache[key] = (now, value)
+        return value
+    
     def get_artist_by_foreign_id(self, foreign_artist_id: str) -> Optional[Dict]:
         """
         Get artist by foreign artist ID (MusicBrainz ID)
@@ -520,19 +569,26 @@ class LidarrClient:
             Artist data if exists, None otherwise
         """
         try:
-            # Search through all artists for matching foreign ID
-            response = requests.get(
+            # Let Lidarr filter by MusicBrainz ID instead of sending every
+            # artist; if it rejects the ID, fall back to the full list
+            response = self.session.get(
                 f"{self.url}/api/v1/artist",
-                headers=self.headers,
+                params={'mbId': foreign_artist_id},
                 timeout=10
             )
+            if response.status_code == 400:
+                response = self.session.get(
+                    f"{self.url}/api/v1/artist",
+                    timeout=10
+                )
             
             if response.status_code == 200:
-                artists = response.json()
-                for artist in artists:
-                    if artist.get('foreignArtistId') == foreign_artist_id:
-                        return artist
-                return None
+                # Still matched here, in case the filter was ignored
+                return next(
+                    (artist for artist in _json(response)
+                     if artist.get('foreignArtistId') == foreign_artist_id),
+                    None
+                )
             else:
                 logger.error(f"Failed to check existing artist: {response.status_code}")
                 return None
@@ -553,10 +609,24 @@ class LidarrClient:
             Dict with success status and message
         """
         try:
-            # Check if artist already exists
+            # The existence check and the settings lookups are independent,
+            # so run them at once rather than one round trip after another
             foreign_artist_id = artist_data.get('foreignArtistId')
+            existing_future = None
             if foreign_artist_id:
-                existing = self.get_artist_by_foreign_id(foreign_artist_id)
+                existing_future = _lookup_executor.submit(self.get_artist_by_foreign_id, foreign_artist_id)
+            settings_futures = [
+                _lookup_executor.submit(self._cached_settings, name, loader)
+                for name, loader in (
+                    ('quality_profiles', self.get_quality_profiles),
+                    ('metadata_profiles', self.get_metadata_profiles),
+                    ('root_folders', self.get_root_folders),
+                )
+            ]
+            
+            # Check if artist already exists
+            if existing_future:
+                existing = existing_future.result()
                 if existing:
                     return {
                         'success': False,
@@ -565,9 +635,7 @@ class LidarrClient:
                     }
             
             # Get quality and metadata profiles
-            quality_profiles = self.get_quality_profiles()
-            metadata_profiles = self.get_metadata_profiles()
-            root_folders = self.get_root_folders()
+            quality_profiles, metadata_profiles, root_folders = (future.result() for future in settings_futures)
             
             if not quality_profiles or not metadata_profiles or not root_folders:
                 return {
@@ -590,15 +658,14 @@ class LidarrClient:
             }
             
             # Add artist
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url}/api/v1/artist",
-                headers=self.headers,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=10
             )
             
             if response.status_code in [200, 201]:
-                artist_response = response.json()
+                artist_response = _json(response)
                 logger.info(f"Added artist: {artist_response.get('artistName')} (ID: {artist_response.get('id')})")
                 
                 return {
@@ -609,6 +676,10 @@ class LidarrClient:
                 }
             else:
                 logger.error(f"Failed to add artist: {response.status_code} - {response.text}")
+                # A cached profile or root folder may have been removed in Lidarr
+                with _settings_cache_lock:
+                    for name in ('quality_profiles', 'metadata_profiles', 'root_folders'):
+                        _settings_cache.pop((self.url, self.api_key, name), None)
                 return {
                     'success': False,
                     'error': f'Failed to add artist: {response.status_code}'
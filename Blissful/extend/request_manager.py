@@ -4,9 +4,17 @@ Handles music request configuration, artist search, and adding artists
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 
 logger = logging.getLogger(__name__)
 
+# Repeat searches (e.g. typeahead) within this window are served from memory
+SEARCH_CACHE_TTL = 30
+SEARCH_CACHE_MAX_ENTRIES = 256
+
 
 class RequestManager:
     """Manages music request system functionality"""
@@ -14,6 +22,28 @@ class RequestManager:
     def __init__(self, config_manager, lidarr_client_class):
         self.config_manager = config_manager
         self.LidarrClient = lidarr_client_class
+        self._search_cache = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        self._inflight = {}
+        self._lidarr_client = None
+        self._client_key = None
+    
+    def _client(self, config):
+        """
+        Get a Lidarr client for the configured URL/API key, reusing the
+        previous instance (and its HTTP session) while the settings are unchanged
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            LidarrClient instance
+        """
+        key = (config.get('lidarr_url'), config.get('lidarr_api_key'))
+        if key != self._client_key:
+            self._lidarr_client = self.LidarrClient(url=key[0], api_key=key[1])
+            self._client_key = key
+        return self._lidarr_client
     
     def get_request_config(self):
         """
@@ -75,9 +105,10 @@ class RequestManager:
                     'error': 'Lidarr not configured'
                 }
             
-            # Search via Lidarr
-            lidarr_client = self.LidarrClient(url=lidarr_url, api_key=lidarr_api_key)
-            results = lidarr_client.search_artist_lidarr(search_term)
+            cache_key = (lidarr_url, lidarr_api_key, search_term.strip().lower())
+            results = self._cached_search(cache_key)
+            if results is None:
+                results = self._search_lidarr(config, cache_key, search_term)
             
             return {
                 'success': True,
@@ -123,11 +154,13 @@ class RequestManager:
                 }
             
             # Add to Lidarr
-            lidarr_client = self.LidarrClient(url=lidarr_url, api_key=lidarr_api_key)
-            result = lidarr_client.add_artist(artist_data, monitored=monitored, search_for_missing=False)
+            result = self._client(config).add_artist(artist_data, monitored=monitored, search_for_missing=False)
             
             if result['success']:
                 logger.info(f"Artist requested by {username}: {result.get('artist_name')}")
+                # Cached lookups would still show the artist as not in the library
+                with self._search_cache_lock:
+                    self._search_cache.clear()
             
             return result
             
@@ -137,3 +170,71 @@ class RequestManager:
                 'success': False,
                 'error': str(e)
             }
+    
+    def _search_lidarr(self, config, key, search_term):
+        """
+        Search Lidarr, letting concurrent identical searches share one request
+        
+        Args:
+            config: Configuration dictionary
+            key: (lidarr_url, api_key, normalized search term)
+            search_term: Artist name to search for
+            
+        Returns:
+            list: Artist results from Lidarr
+        """
+        with self._search_cache_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            results = self._client(config).search_artist_lidarr(search_term)
+            if results:
+                self._cache_search(key, results)
+            future.set_result(results)
+            return results
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._search_cache_lock:
+                self._inflight.pop(key, None)
+    
+    def _cached_search(self, key):
+        """
+        Get fresh search results from the cache
+        
+        Args:
+            key: (lidarr_url, api_key, normalized search term)
+            
+        Returns:
+            list: Cached results, or None if missing or expired
+        """
+        with self._search_cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= SEARCH_CACHE_TTL:
+                del self._search_cache[key]
+                return None
+            self._search_cache.move_to_end(key)
+            return entry[1]
+    
+    def _cache_search(self, key, results):
+        """
+        Store search results, evicting the least recently used entries
+        
+        Args:
+            key: (lidarr_url, api_key, normalized search term)
+            results: Artist results from Lidarr
+        """
+        with self._search_cache_lock:
+            self._search_cache[key] = (time.monotonic(), results)
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+                self._search_cache.popitem(last=False)
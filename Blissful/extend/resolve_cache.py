@@ -0,0 +1,129 @@
+"""
+Resolve Cache for Blissful
+Remembers which URL a track was found at (or that no source had it), so
+repeat downloads skip the yt-dlp search round trips
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long a found URL / a "no source had it" result is trusted (seconds)
+RESOLVE_HIT_TTL = 30 * 24 * 3600
+RESOLVE_MISS_TTL = 24 * 3600
+
+STATUS_OK = 'ok'
+STATUS_MISS = 'miss'
+
+
+class ResolveCache:
+    """SQLite-backed map of track -> resolved source URL or miss marker"""
+    
+    def __init__(self, db_path):
+        """
+        Initialize resolve cache
+        
+        Args:
+            db_path: SQLite database file
+        """
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS resolve '
+                '(key TEXT PRIMARY KEY, source TEXT, ts INTEGER, status TEXT)'
+            )
+    
+    @staticmethod
+    def key(artist: str, title: str, album: str = '') -> str:
+        """
+        Build the cache key for a track
+        
+        Args:
+            artist: Artist name
+            title: Track title
+            album: Album name (optional)
+        
+        Returns:
+            Hex digest of the normalized artist/album/title
+        """
+        normalized = f"{artist.strip()}|{album.strip()}|{title.strip()}".lower()
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        """
+        Look up a track
+        
+        Args:
+            key: Key from ResolveCache.key
+        
+        Returns:
+            (status, source) if a fresh entry exists, else None. For misses,
+            source is the signature of the source list that was searched.
+        """
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    'SELECT status, source, ts FROM resolve WHERE key = ?', (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Resolve cache lookup failed: {e}")
+            return None
+        
+        if row is None:
+            return None
+        status, source, ts = row
+        ttl = RESOLVE_HIT_TTL if status == STATUS_OK else RESOLVE_MISS_TTL
+        if time.time() - ts > ttl:
+            return None
+        return status, source
+    
+    def put(self, key: str, status: str, source: str):
+        """
+        Record a resolution
+        
+        Args:
+            key: Key from ResolveCache.key
+            status: STATUS_OK or STATUS_MISS
+            source: Resolved URL (ok) or source list signature (miss)
+        """
+        try:
+            with self._lock, self._db:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO resolve (key, source, ts, status) VALUES (?, ?, ?, ?)',
+                    (key, source, int(time.time()), status)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Resolve cache write failed: {e}")
+    
+    def delete(self, key: str):
+        """
+        Forget a track (e.g. its cached URL stopped working)
+        
+        Args:
+            key: Key from ResolveCache.key
+        """
+        try:
+            with self._lock, self._db:
+                self._db.execute('DELETE FROM resolve WHERE key = ?', (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"Resolve cache delete failed: {e}")
+    
+    @staticmethod
+    def sources_signature(sources: list) -> str:
+        """
+        Fingerprint a source list, so a cached miss only applies while the
+        same sources (priorities) are configured
+        
+        Args:
+            sources: yt-dlp source strings that were searched
+        
+        Returns:
+            Hex digest
+        """
+        return hashlib.blake2b('\n'.join(sources).encode('utf-8'), digest_size=8).hexdigest()
@@ -8,8 +8,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Seconds to serve album lookups from cache before asking Lidarr again
+ALBUM_CACHE_TIMEOUT = 60
 
-def register_routes(app, config_manager, lidarr_client, download_manager, 
+
+def _is_success_response(rv):
+    """Only cache plain 200 responses, not (response, status) error tuples"""
+    return not isinstance(rv, tuple)
+
+
+def register_routes(app, cache, config_manager, lidarr_client, download_manager, 
                     audio_converter, source_manager, auth_manager, 
                     request_manager, album_manager, track_manager, 
                     sources_api, system_utils):
@@ -18,6 +26,7 @@ def register_routes(app, config_manager, lidarr_client, download_manager,
     
     Args:
         app: Flask application instance
+        cache: Flask-Caching cache instance
         config_manager: Configuration manager
         lidarr_client: Lidarr client class
         download_manager: Download manager
@@ -52,7 +61,8 @@ def register_routes(app, config_manager, lidarr_client, download_manager,
             'status': 'healthy',
             'version': '1.0.0',
             'ffmpeg_available': audio_converter.check_ffmpeg(),
-            'ytdlp_available': download_manager.check_ytdlp()
+            'ytdlp_available': download_manager.check_ytdlp(),
+            'source_health': download_manager.get_source_health()
         })
     
     @app.route('/api/config', methods=['GET'])
@@ -114,6 +124,27 @@ def register_routes(app, config_manager, lidarr_client, download_manager,
         status_code = result.pop('status_code', 200)
         return jsonify(result), status_code
     
+    @app.route('/api/auth/logout', methods=['POST'])
+    def auth_logout():
+        """Forget cached logins for the user owning the access token"""
+        data = request.json or {}
+        access_token = data.get('access_token')
+        if not access_token:
+            return jsonify({'success': False, 'error': 'Access token required'}), 401
+        auth_manager.invalidate(access_token, data.get('provider'))
+        return jsonify({'success': True})
+    
+    @app.route('/api/auth/any', methods=['POST'])
+    def auth_any():
+        """Authenticate against every enabled backend, first success wins"""
+        data = request.json
+        username = data.get('username')
+        password = data.get('password')
+        
+        result = auth_manager.authenticate_any(username, password)
+        status_code = result.pop('status_code', 200)
+        return jsonify(result), status_code
+    
     # ==================== REQUEST SYSTEM ROUTES ====================
     
     @app.route('/api/request/config', methods=['GET'])
@@ -143,6 +174,7 @@ def register_routes(app, config_manager, lidarr_client, download_manager,
     # ==================== ALBUM ROUTES ====================
     
     @app.route('/api/album-info/<album_id>', methods=['GET'])
+    @cache.cached(timeout=ALBUM_CACHE_TIMEOUT, response_filter=_is_success_response)
     def get_album_info(album_id):
         """Fetch album information from Lidarr API"""
         result = album_manager.get_album_info(album_id)
@@ -152,7 +184,8 @@ def register_routes(app, config_manager, lidarr_client, download_manager,
     
     @app.route('/api/album-tracks/<album_id>', methods=['GET'])
     def get_album_tracks(album_id):
-        """Fetch album tracks with their file status"""
+        """Fetch album tracks with their file status (not cached - hasFile
+        changes as downloads land and Lidarr rescans)"""
         result = album_manager.get_album_tracks(album_id)
         if not result['success']:
             return jsonify(result), 404 if 'not found' in result.get('error', '') else 400
@@ -4,8 +4,7 @@ Handles individual track downloads with Lidarr integration
 """
 
 import logging
-from pathlib import Path
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +17,26 @@ class TrackManager:
         self.LidarrClient = lidarr_client_class
         self.download_manager = download_manager
         self.audio_converter = audio_converter
+        self._lidarr_client = None
+        self._client_key = None
+        self._lookup_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='lidarr-lookup')
+    
+    def _client(self, config):
+        """
+        Get a Lidarr client for the configured URL/API key, reusing the
+        previous instance (and its HTTP session) while the settings are unchanged
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            LidarrClient instance
+        """
+        key = (config.get('lidarr_url'), config.get('lidarr_api_key'))
+        if key != self._client_key:
+            self._lidarr_client = self.LidarrClient(url=key[0], api_key=key[1])
+            self._client_key = key
+        return self._lidarr_client
     
     def download_track(self, artist, title, album='', album_id=None, track_number=1):
         """
@@ -37,6 +56,12 @@ class TrackManager:
             logger.info(f"Downloading track: {artist} - {title}")
             
             config = self.config_manager.get_config()
+            use_lidarr = bool(album_id and config.get('lidarr_url') and config.get('lidarr_api_key'))
+            
+            # Fetch album details from Lidarr while the track downloads
+            album_future = None
+            if use_lidarr:
+                album_future = self._lookup_executor.submit(self._fetch_album, config, album_id)
             
             # Search and download track
             download_result = self.download_manager.download_track(
@@ -44,26 +69,41 @@ class TrackManager:
                 title=title,
                 album=album,
                 output_format=config.get('output_format', 'mp3'),
-                source_priorities=config.get('source_priorities', [])
+                source_priorities=config.get('source_priorities', []),
+                quality=config.get('quality', '320k')
             )
             
             if not download_result['success']:
                 return download_result
             
-            # Convert to desired format
+            # Convert to desired format on the shared process pool, so the
+            # CPU-bound encode doesn't block other requests' greenlets
             output_format = config.get('output_format', 'mp3')
-            converted_file = self.audio_converter.convert(
+            metadata = None
+            if config.get('embed_metadata', True):
+                metadata = {
+                    'artist': artist,
+                    'title': title,
+                    'album': album,
+                    'track': track_number
+                }
+            
+            converted_file = self.audio_converter.convert_pooled(
                 input_file=download_result['file_path'],
                 output_format=output_format,
-                quality=config.get('quality', '320k')
+                quality=config.get('quality', '320k'),
+                metadata=metadata,
+                target_level=self.audio_converter.get_loudness_target(config)
             )
             
             # Organize file if album_id is provided
             final_path = converted_file
-            if album_id and config.get('lidarr_url') and config.get('lidarr_api_key'):
+            if use_lidarr:
                 final_path = self._organize_track_file(
+                    config,
                     converted_file, 
                     album_id, 
+                    album_future.result(),
                     title, 
                     album, 
                     track_number, 
@@ -72,8 +112,8 @@ class TrackManager:
             
             # Trigger Lidarr rescan
             rescan_triggered = False
-            if album_id and config.get('lidarr_url') and config.get('lidarr_api_key'):
-                rescan_triggered = self._trigger_lidarr_rescan(album_id)
+            if use_lidarr:
+                rescan_triggered = self._trigger_lidarr_rescan(config, album_id)
             
             return {
                 'success': True,
@@ -90,13 +130,32 @@ class TrackManager:
                 'error': str(e)
             }
     
-    def _organize_track_file(self, converted_file, album_id, title, album, track_number, output_format):
+    def _fetch_album(self, config, album_id):
+        """
+        Fetch album details from Lidarr
+        
+        Args:
+            config: Configuration snapshot for this download
+            album_id: Lidarr album ID
+            
+        Returns:
+            dict: Album data, or None if unavailable
+        """
+        try:
+            return self._client(config).get_album(int(album_id))
+        except Exception as e:
+            logger.warning(f"Failed to fetch album {album_id} from Lidarr: {e}")
+            return None
+    
+    def _organize_track_file(self, config, converted_file, album_id, album_data, title, album, track_number, output_format):
         """
         Organize track file into Lidarr directory structure
         
         Args:
+            config: Configuration snapshot for this download
             converted_file: Path to converted audio file
             album_id: Lidarr album ID
+            album_data: Album details prefetched from Lidarr
             title: Track title
             album: Album name
             track_number: Track number
@@ -106,15 +165,6 @@ class TrackManager:
             str: Final file path
         """
         try:
-            config = self.config_manager.get_config()
-            
-            # Get album details from Lidarr
-            lidarr_client = self.LidarrClient(
-                url=config.get('lidarr_url'),
-                api_key=config.get('lidarr_api_key')
-            )
-            
-            album_data = lidarr_client.get_album(int(album_id))
             if not album_data:
                 logger.warning(f"Album {album_id} not found in Lidarr, keeping file in downloads")
                 return converted_file
@@ -141,44 +191,31 @@ class TrackManager:
             
             logger.info(f"Target path (before mapping): {target_path}")
             
-            # Move file to target location with path mapping
-            if config.get('lidarr_path_mapping'):
-                final_path = self.download_manager.move_to_target(
-                    source_file=converted_file,
-                    target_path=target_path,
-                    path_mapping=config.get('lidarr_path_mapping')
-                )
-            else:
-                # Direct move (no path mapping) - use Path for platform compatibility
-                target = Path(target_path)
-                target.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(converted_file, str(target))
-                final_path = str(target)
-                logger.info(f"Moved file to: {final_path}")
-            
-            return final_path
+            # Move file to target location (path mapping is optional); a
+            # cross-device move is published with a rename once fully copied
+            return self.download_manager.move_to_target(
+                source_file=converted_file,
+                target_path=target_path,
+                path_mapping=config.get('lidarr_path_mapping')
+            )
             
         except Exception as e:
             logger.warning(f"Failed to organize file to Lidarr path: {e}", exc_info=True)
             return converted_file
     
-    def _trigger_lidarr_rescan(self, album_id):
+    def _trigger_lidarr_rescan(self, config, album_id):
         """
         Trigger Lidarr to rescan an album
         
         Args:
+            config: Configuration snapshot for this download
             album_id: Lidarr album ID
             
         Returns:
             bool: True if rescan triggered successfully
         """
         try:
-            config = self.config_manager.get_config()
-            
-            lidarr_client = self.LidarrClient(
-                url=config.get('lidarr_url'),
-                api_key=config.get('lidarr_api_key')
-            )
+            lidarr_client = self._client(config)
             
             rescan_triggered = lidarr_client.rescan_album(int(album_id))
             
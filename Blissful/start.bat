@@ -42,7 +42,7 @@ if %errorlevel% neq 0 (
 REM Check FFmpeg
 ffmpeg -version >nul 2>&1
 if %errorlevel% neq 0 (
-    echo [!] FFmpeg not found! Some features may not work.
+    echo [!] FFmpeg not found! Blissful will not start without it.
     echo     Download from: https://ffmpeg.org/download.html
 ) else (
     echo [OK] FFmpeg found
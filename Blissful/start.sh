@@ -53,7 +53,7 @@ fi
 if command -v ffmpeg &> /dev/null; then
     echo "[OK] FFmpeg found"
 else
-    echo "[!] FFmpeg not found! Some features may not work."
+    echo "[!] FFmpeg not found! Blissful will not start without it."
     echo "    Install with: sudo apt install ffmpeg (Debian/Ubuntu)"
     echo "               or: brew install ffmpeg (macOS)"
 fi
@@ -0,0 +1,15 @@
+"""
+WSGI entrypoint for Blissful
+Used by gunicorn in production: gunicorn -k gevent wsgi:app
+"""
+
+# Patch the standard library before anything imports requests/socket so
+# Lidarr calls, downloads and ffmpeg waits yield to other greenlets
+from gevent import monkey
+monkey.patch_all()
+
+from Blissful import create_app  # noqa: E402
+
+app = create_app()
+
+__all__ = ['app']